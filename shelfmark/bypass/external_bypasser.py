@@ -1,22 +1,28 @@
 """External Cloudflare bypasser using FlareSolverr."""
 
+import atexit
+import json
 import random
+import threading
 import time
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from functools import cached_property
+from http import HTTPStatus
 from typing import TYPE_CHECKING
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from shelfmark.bypass import BypassCancelledError
 from shelfmark.core.config import config
 from shelfmark.core.logger import setup_logger
 from shelfmark.core.utils import normalize_http_url
-from shelfmark.download.network import get_ssl_verify
+from shelfmark.download.network import AAMirrorSelector, get_ssl_verify
 
 if TYPE_CHECKING:
     from threading import Event
 
-    from shelfmark.download import network
-
 logger = setup_logger(__name__)
 _RNG = random.SystemRandom()
 
@@ -25,11 +31,60 @@ CONNECT_TIMEOUT = 10
 MAX_READ_TIMEOUT = 120
 READ_TIMEOUT_BUFFER = 15
 
+# Upper bound on the bypasser's JSON envelope; reading stops once it is exceeded
+MAX_BODY_BYTES = 16 * 1024 * 1024
+_BODY_CHUNK_BYTES = 64 * 1024
+
 # Retry settings
 MAX_RETRY = 5
 BACKOFF_BASE = 1.0
 BACKOFF_CAP = 10.0
 
+# Every attempt hits the same FlareSolverr endpoint, so keep connections alive
+# across retries instead of paying a fresh TCP/TLS handshake per request.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+# 4xx responses from the bypasser itself that are still worth retrying
+_RETRYABLE_CLIENT_STATUSES = frozenset({HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.TOO_MANY_REQUESTS})
+# Substrings of bypasser error messages that indicate retrying cannot help
+_FATAL_MESSAGE_MARKERS = ("invalid url", "unsupported", "404")
+# Chrome network errors reported by the bypasser when the target host itself is unreachable
+_MIRROR_DOWN_MESSAGE_MARKERS = (
+    "err_name_not_resolved",
+    "err_connection_refused",
+    "err_connection_reset",
+    "err_connection_closed",
+    "err_connection_timed_out",
+    "err_address_unreachable",
+)
+
+
+class _FetchOutcome(Enum):
+    """Classification of a single external bypasser attempt."""
+
+    OK = auto()
+    RETRY = auto()  # Transient failure, worth backing off and retrying
+    FATAL = auto()  # Permanent failure, retrying cannot help
+    MIRROR_DOWN = auto()  # Bypasser is fine but the target host is unreachable
+
+
+@dataclass
+class _InflightFetch:
+    """A bypasser fetch in progress; waiters share the leader's outcome."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: tuple[_FetchOutcome, str | None] = (_FetchOutcome.RETRY, None)
+
+
+_inflight_lock = threading.Lock()
+_inflight: dict[str, _InflightFetch] = {}
+# Waiters on an in-flight fetch wake this often to honour their own cancel flag
+_INFLIGHT_WAIT_SLICE_SECONDS = 0.5
+
 
 def _coerce_config_str(value: object, default: str) -> str:
     """Return a string config value or a safe default."""
@@ -47,8 +102,37 @@ def _coerce_timeout_ms(value: object, default: int) -> int:
     return default
 
 
-def _fetch_via_bypasser(target_url: str) -> str | None:
-    """Make a single request to the external bypasser service. Returns HTML or None."""
+def _classify_failure_message(message: object) -> _FetchOutcome:
+    """Classify a non-ok bypasser status message as retryable or permanent."""
+    lowered = str(message).lower()
+    if any(marker in lowered for marker in _FATAL_MESSAGE_MARKERS):
+        return _FetchOutcome.FATAL
+    if any(marker in lowered for marker in _MIRROR_DOWN_MESSAGE_MARKERS):
+        return _FetchOutcome.MIRROR_DOWN
+    return _FetchOutcome.RETRY
+
+
+@dataclass(frozen=True)
+class _BypasserEndpoint:
+    """FlareSolverr endpoint settings resolved once per bypass operation."""
+
+    post_url: str
+    verify: bool
+    timeout_ms: int
+    read_timeout: float
+
+    @cached_property
+    def body_prefix(self) -> bytes:
+        """Serialized request body up to the target URL, which is the only per-call field."""
+        return b'{"cmd":"request.get","maxTimeout":%d,"url":' % self.timeout_ms
+
+    def request_body(self, target_url: str) -> bytes:
+        """Build the FlareSolverr request.get body for a target URL."""
+        return self.body_prefix + json.dumps(target_url).encode() + b"}"
+
+
+def _resolve_bypasser_endpoint() -> _BypasserEndpoint | None:
+    """Resolve the configured bypasser endpoint, or None if it is not configured."""
     raw_bypasser_url = _coerce_config_str(
         config.get("EXT_BYPASSER_URL", "http://flaresolverr:8191"),
         "http://flaresolverr:8191",
@@ -63,24 +147,58 @@ def _fetch_via_bypasser(target_url: str) -> str | None:
         )
         return None
 
-    read_timeout = min((bypasser_timeout / 1000) + READ_TIMEOUT_BUFFER, MAX_READ_TIMEOUT)
+    return _BypasserEndpoint(
+        post_url=f"{bypasser_url}{bypasser_path}",
+        verify=get_ssl_verify(bypasser_url),
+        timeout_ms=bypasser_timeout,
+        read_timeout=min((bypasser_timeout / 1000) + READ_TIMEOUT_BUFFER, MAX_READ_TIMEOUT),
+    )
+
+
+def _read_limited_body(response: requests.Response) -> bytearray | None:
+    """Read a streamed response body, or return None if it exceeds MAX_BODY_BYTES."""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=_BODY_CHUNK_BYTES):
+        body += chunk
+        if len(body) > MAX_BODY_BYTES:
+            return None
+    return body
+
+
+def _fetch_via_bypasser(
+    endpoint: _BypasserEndpoint, target_url: str
+) -> tuple[_FetchOutcome, str | None]:
+    """Make a single request to the external bypasser service.
 
+    Returns the attempt outcome and, on success, the page HTML.
+    """
     try:
-        response = requests.post(
-            f"{bypasser_url}{bypasser_path}",
+        with _SESSION.post(
+            endpoint.post_url,
             headers={"Content-Type": "application/json"},
-            json={
-                "cmd": "request.get",
-                "url": target_url,
-                "maxTimeout": bypasser_timeout,
-            },
-            timeout=(CONNECT_TIMEOUT, read_timeout),
-            verify=get_ssl_verify(bypasser_url),
-        )
-        response.raise_for_status()
-        result = response.json()
+            data=endpoint.request_body(target_url),
+            timeout=(CONNECT_TIMEOUT, endpoint.read_timeout),
+            verify=endpoint.verify,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            body = _read_limited_body(response)
+
+        if body is None:
+            logger.warning(
+                "External bypasser response for '%s' exceeded %d bytes",
+                target_url,
+                MAX_BODY_BYTES,
+            )
+            return _FetchOutcome.FATAL, None
+
+        # Decode straight from bytes: skips requests' charset sniffing on the
+        # (often large) HTML-wrapping envelope.
+        result = json.loads(body)
 
-        status = result.get("status", "unknown")
+        # A well-formed envelope always has these keys; anything missing or of
+        # the wrong shape is handled below as a malformed response.
+        status = result["status"]
         message = result.get("message", "")
         logger.debug("External bypasser response for '%s': %s - %s", target_url, status, message)
 
@@ -91,30 +209,70 @@ def _fetch_via_bypasser(target_url: str) -> str | None:
                 status,
                 message,
             )
-            return None
+            return _classify_failure_message(message), None
 
-        solution = result.get("solution")
-        html = solution.get("response", "") if solution else ""
+        html = result["solution"]["response"]
 
         if not html:
             logger.warning("External bypasser returned empty response for '%s'", target_url)
-            return None
+            return _FetchOutcome.RETRY, None
 
     except requests.exceptions.Timeout:
         logger.warning(
             "External bypasser timed out for '%s' (connect: %ss, read: %.0fs)",
             target_url,
             CONNECT_TIMEOUT,
-            read_timeout,
+            endpoint.read_timeout,
         )
+    except requests.exceptions.HTTPError as e:
+        logger.warning("External bypasser request failed for '%s': %s", target_url, e)
+        status_code = e.response.status_code if e.response is not None else None
+        if (
+            status_code is not None
+            and HTTPStatus.BAD_REQUEST <= status_code < HTTPStatus.INTERNAL_SERVER_ERROR
+            and status_code not in _RETRYABLE_CLIENT_STATUSES
+        ):
+            return _FetchOutcome.FATAL, None
     except requests.exceptions.RequestException as e:
         logger.warning("External bypasser request failed for '%s': %s", target_url, e)
     except (KeyError, TypeError, ValueError) as e:
         logger.warning("External bypasser returned malformed response for '%s': %s", target_url, e)
     else:
-        return html
+        return _FetchOutcome.OK, html
 
-    return None
+    return _FetchOutcome.RETRY, None
+
+
+def _fetch_deduplicated(
+    endpoint: _BypasserEndpoint, target_url: str, cancel_flag: Event | None = None
+) -> tuple[_FetchOutcome, str | None]:
+    """Fetch a page, joining an identical fetch that is already in flight.
+
+    Waiters never issue their own request: they wait for the leader and return
+    its outcome, so a failed fetch is retried through the caller's normal
+    backoff loop (where one caller becomes the next leader). Nothing is kept
+    once the fetch completes, since callers re-fetch a URL to get fresh content
+    (e.g. after an AA countdown).
+    """
+    with _inflight_lock:
+        pending = _inflight.get(target_url)
+        if pending is None:
+            inflight = _inflight[target_url] = _InflightFetch()
+
+    if pending is not None:
+        logger.debug("Waiting for in-flight external bypass of '%s'", target_url)
+        while not pending.done.wait(_INFLIGHT_WAIT_SLICE_SECONDS):
+            _check_cancelled(cancel_flag, "while waiting for in-flight bypass")
+        return pending.result
+
+    try:
+        outcome, html = _fetch_via_bypasser(endpoint, target_url)
+        inflight.result = (outcome, html)
+        return outcome, html
+    finally:
+        with _inflight_lock:
+            _inflight.pop(target_url, None)
+        inflight.done.set()
 
 
 def _check_cancelled(cancel_flag: Event | None, context: str) -> None:
@@ -126,37 +284,65 @@ def _check_cancelled(cancel_flag: Event | None, context: str) -> None:
 
 
 def _sleep_with_cancellation(seconds: float, cancel_flag: Event | None) -> None:
-    """Sleep for the specified duration, checking for cancellation each second."""
-    for _ in range(int(seconds)):
-        _check_cancelled(cancel_flag, "during backoff")
-        time.sleep(1)
-    remaining = seconds - int(seconds)
-    if remaining > 0:
-        time.sleep(remaining)
+    """Sleep for the specified duration, waking immediately if cancelled."""
+    if cancel_flag is None:
+        time.sleep(seconds)
+        return
+    if cancel_flag.wait(seconds):
+        logger.info("External bypasser cancelled during backoff")
+        msg = "Bypass cancelled"
+        raise BypassCancelledError(msg)
+
+
+def _rotate_selector(sel: AAMirrorSelector) -> bool:
+    """Advance to the next mirror or DNS provider. Returns True if anything rotated."""
+    new_base, action = sel.next_mirror_or_rotate_dns()
+    if action in ("mirror", "dns") and new_base:
+        logger.info("Rotated %s for retry", action)
+        return True
+    return False
 
 
 def get_bypassed_page(
     url: str,
-    selector: network.AAMirrorSelector | None = None,
+    selector: AAMirrorSelector | None = None,
     cancel_flag: Event | None = None,
 ) -> str | None:
     """Fetch HTML via external bypasser with retries and mirror rotation."""
-    from shelfmark.download import network as network_module
-
-    sel = selector or network_module.AAMirrorSelector()
+    sel = selector or AAMirrorSelector()
+    endpoint = _resolve_bypasser_endpoint()
+    if endpoint is None:
+        return None
+    delay = BACKOFF_BASE
 
     for attempt in range(1, MAX_RETRY + 1):
         _check_cancelled(cancel_flag, "by user")
 
         attempt_url = sel.rewrite(url)
-        result = _fetch_via_bypasser(attempt_url)
-        if result:
-            return result
+        outcome, html = _fetch_deduplicated(endpoint, attempt_url, cancel_flag)
+        if outcome is _FetchOutcome.OK:
+            return html
+        if outcome is _FetchOutcome.FATAL:
+            logger.info("External bypasser failure for '%s' is not retryable", attempt_url)
+            break
 
         if attempt == MAX_RETRY:
             break
 
-        delay = min(BACKOFF_CAP, BACKOFF_BASE * (2 ** (attempt - 1))) + _RNG.random()
+        mirror_down = outcome is _FetchOutcome.MIRROR_DOWN
+        if mirror_down and _rotate_selector(sel):
+            # Backing off will not revive a dead mirror; try the next one right away.
+            logger.info(
+                "External bypasser attempt %s/%s could not reach '%s', retrying immediately",
+                attempt,
+                MAX_RETRY,
+                attempt_url,
+            )
+            continue
+
+        # Decorrelated jitter: spreads retries from concurrent workers apart
+        # instead of having them all wake up on the same power-of-two schedule.
+        delay = min(BACKOFF_CAP, _RNG.uniform(BACKOFF_BASE, delay * 3))
         logger.info(
             "External bypasser attempt %s/%s failed, retrying in %.1fs",
             attempt,
@@ -166,8 +352,8 @@ def get_bypassed_page(
 
         _sleep_with_cancellation(delay, cancel_flag)
 
-        new_base, action = sel.next_mirror_or_rotate_dns()
-        if action in ("mirror", "dns") and new_base:
-            logger.info("Rotated %s for retry", action)
+        # A mirror-down failure already tried (and exhausted) rotation above.
+        if not mirror_down:
+            _rotate_selector(sel)
 
     return None
@@ -2,10 +2,12 @@
 
 import _thread
 import asyncio
+import atexit
 import json
+import math
 import os
 import random
-import shutil
+import re
 import signal
 import socket
 import stat
@@ -15,15 +17,23 @@ import tempfile
 import threading
 import time
 import traceback
-from contextlib import suppress
+from collections import OrderedDict, deque
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from http import HTTPStatus
+from http.cookiejar import DefaultCookiePolicy
+from itertools import islice
 from pathlib import Path
 from threading import Event
-from typing import Any, Protocol, TypedDict, TypeGuard
+from typing import TYPE_CHECKING, Any, Protocol, TypedDict, TypeGuard
 from urllib.parse import urlparse
 
+import emoji
 import requests
+from mycdp import network as cdp_network
+from requests.adapters import HTTPAdapter
 from seleniumbase import cdp_driver
 from seleniumbase.undetected.cdp_driver.connection import ProtocolException
 
@@ -37,6 +47,9 @@ from shelfmark.core.logger import setup_logger
 from shelfmark.download import network
 from shelfmark.download.network import get_proxies, get_ssl_verify
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
 logger = setup_logger(__name__)
 
 SELENIUMBASE_RUNTIME_ROOT = Path(tempfile.gettempdir()) / "shelfmark" / "seleniumbase"
@@ -48,8 +61,23 @@ _BYPASSED_BODY_LENGTH_MIN = 100_000
 _BYPASS_EMOJI_MATCH_MIN = 3
 _LOADING_BODY_LENGTH_MAX = 50
 _PAGE_BODY_PREVIEW_CHARS = 500
+# Body text is trimmed and cut in the page: one character past the "long page"
+# threshold is all _is_bypassed needs, so large pages never cross the socket.
+_PAGE_INFO_SCRIPT = (
+    "[document.title || '', "
+    f"document.body ? document.body.innerText.trim().slice(0, {_BYPASSED_BODY_LENGTH_MIN + 1}) : '', "
+    "window.location.href]"
+)
+_PAGE_INFO_FIELDS = 3
 _BROWSER_START_TIMEOUT_SECONDS = 45.0
+_BROWSER_IDLE_TIMEOUT_SECONDS = 120.0
+_BROWSER_POOL_MAX_IDLE = 2
 _BYPASS_SUBPROCESS_TIMEOUT_SECONDS = 420.0
+_HOST_RULES_TTL_SECONDS = 300.0
+_CANCEL_POLL_SECONDS = 0.25
+_DRIVER_USER_AGENT_ATTR = "_shelfmark_user_agent"
+# Set on the driver whose launch started the shared debug recording; only it stops it
+_DRIVER_RECORDING_ATTR = "_shelfmark_owns_recording"
 _BYPASS_CHILD_ENV = "SHELFMARK_INTERNAL_BYPASSER_CHILD"
 
 # Challenge detection indicators
@@ -69,6 +97,16 @@ DDOS_GUARD_INDICATORS = [
 ]
 
 
+def _compile_indicators(*indicator_lists: list[str]) -> re.Pattern[str]:
+    """Compile indicator substrings into one alternation so text is scanned once."""
+    return re.compile("|".join(re.escape(ind) for group in indicator_lists for ind in group))
+
+
+_CLOUDFLARE_PATTERN = _compile_indicators(CLOUDFLARE_INDICATORS)
+_DDOS_GUARD_PATTERN = _compile_indicators(DDOS_GUARD_INDICATORS)
+_PROTECTION_PATTERN = _compile_indicators(CLOUDFLARE_INDICATORS, DDOS_GUARD_INDICATORS)
+
+
 class _DisplayState(TypedDict):
     ffmpeg: subprocess.Popen[bytes] | None
     ffmpeg_output: Path | None
@@ -86,9 +124,27 @@ DISPLAY: _DisplayState = {
     "ffmpeg": None,
     "ffmpeg_output": None,
 }
+# Docker helper subprocesses run concurrently (one per base domain). LOCKED only
+# guards the count of live helpers and the machine-wide orphan sweep, which runs
+# once the last helper has exited so it can never kill a sibling's browser.
 LOCKED = threading.Lock()
-_PGREP_PATH = shutil.which("pgrep")
-_PKILL_PATH = shutil.which("pkill")
+_active_helpers = 0
+
+
+@dataclass
+class _DomainLock:
+    """A base domain's bypass lock plus the number of callers holding or awaiting it."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    users: int = 0
+
+
+# Per-base-domain bypass locks so different sites can be bypassed concurrently.
+# Entries only live while a bypass for that domain is running or queued.
+_domain_locks: dict[str, _DomainLock] = {}
+_domain_locks_lock = threading.Lock()
+_PROC_DIR = "/proc"
+_ORPHAN_PROCESS_NAMES = (b"chrome", b"chromium", b"Xvfb", b"ffmpeg")
 _RNG = random.SystemRandom()
 
 _CDP_OPERATION_ERRORS = (
@@ -211,6 +267,9 @@ class _CdpWorker:
             msg = "CDP worker loop failed to start"
             raise RuntimeError(msg)
 
+    def is_running(self) -> bool:
+        return bool(self._loop and self._loop.is_running() and not self._loop.is_closed())
+
     def run(self, coro: Any, timeout: float | None = None) -> Any:
         self.start()
         if not self._loop or self._loop.is_closed():
@@ -222,13 +281,136 @@ class _CdpWorker:
 
 _CDP_WORKER = _CdpWorker()
 
+
+@dataclass
+class _IdleBrowser:
+    driver: Any
+    proxy: str | None
+    generation: int
+    released_at: float
+
+
+class _BrowserPool:
+    """Keep CDP browsers warm between in-process bypasses.
+
+    Browsers are bound to the CDP worker loop's websocket connections, so the
+    pool is only used when bypasses run on ``_CDP_WORKER`` (not in the Docker
+    helper subprocess, which exits after one bypass). Browsers are keyed by
+    proxy; a DNS rotation bumps the generation so browsers launched with stale
+    ``--host-resolver-rules`` are closed instead of reused.
+    """
+
+    def __init__(self, idle_timeout: float, max_idle: int) -> None:
+        self._idle: deque[_IdleBrowser] = deque()
+        self._lock = _NATIVE_LOCK()
+        self._idle_timeout = idle_timeout
+        self._max_idle = max_idle
+        self._generation = 0
+        self._reap_task: asyncio.Task[None] | None = None
+
+    def invalidate(self, *_args: object) -> None:
+        """Mark every pooled browser as stale (e.g. after a DNS rotation)."""
+        with self._lock:
+            self._generation += 1
+
+    def _pop_stale(self) -> list[Any]:
+        """Remove and return idle browsers that timed out or predate a DNS rotation."""
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                entry
+                for entry in self._idle
+                if entry.generation != self._generation
+                or now - entry.released_at >= self._idle_timeout
+            ]
+            for entry in stale:
+                self._idle.remove(entry)
+        return [entry.driver for entry in stale]
+
+    def _pop_reusable(self, proxy: str | None) -> Any | None:
+        """Remove and return the most recently released browser for ``proxy``."""
+        with self._lock:
+            for entry in reversed(self._idle):
+                if entry.proxy == proxy:
+                    self._idle.remove(entry)
+                    return entry.driver
+        return None
+
+    async def acquire(self, url: str) -> Any:
+        """Return a warm browser for ``url``'s proxy, launching one if needed."""
+        for stale_driver in self._pop_stale():
+            await _close_cdp_driver(stale_driver)
+        driver = self._pop_reusable(_get_proxy_string(url))
+        if driver is None:
+            return await _create_cdp_browser(url)
+        logger.debug("Reusing pooled Chrome browser")
+        _start_debug_recording(driver)
+        return driver
+
+    async def release(self, driver: Any, url: str) -> None:
+        """Return a healthy browser to the pool, closing it if the pool is full."""
+        await _stop_driver_recording(driver)
+        with self._lock:
+            pooled = len(self._idle) < self._max_idle
+            if pooled:
+                self._idle.append(
+                    _IdleBrowser(
+                        driver=driver,
+                        proxy=_get_proxy_string(url),
+                        generation=self._generation,
+                        released_at=time.monotonic(),
+                    )
+                )
+        if not pooled:
+            await _close_cdp_driver(driver)
+            return
+        if self._reap_task is None or self._reap_task.done():
+            self._reap_task = asyncio.get_running_loop().create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        """Close idle browsers as they time out, until the pool is empty."""
+        while True:
+            await asyncio.sleep(self._idle_timeout)
+            for driver in self._pop_stale():
+                await _close_cdp_driver(driver)
+            with self._lock:
+                if not self._idle:
+                    return
+
+    async def close_all(self) -> None:
+        """Close every pooled browser."""
+        with self._lock:
+            drivers = [entry.driver for entry in self._idle]
+            self._idle.clear()
+        for driver in drivers:
+            await _close_cdp_driver(driver)
+
+
+_BROWSER_POOL = _BrowserPool(_BROWSER_IDLE_TIMEOUT_SECONDS, _BROWSER_POOL_MAX_IDLE)
+network.register_dns_rotation_callback(_BROWSER_POOL.invalidate)
+
+
 # Cookie storage - shared with requests library for Cloudflare bypass
-# Nested mapping of domain to cookie name to cookie metadata.
-_cf_cookies: dict[str, dict] = {}
+# Cloudflare ties cf_clearance to the User-Agent that solved the challenge, so a
+# domain's cookies and UA live in one entry of a single LRU (capped at
+# _CF_MAX_DOMAINS so long-running workers don't grow without bound) and are
+# always stored, evicted and cleared together.
+_CF_MAX_DOMAINS = 512
+
+
+@dataclass
+class _CFSession:
+    """Bypass cookies for a base domain plus the UA that obtained them."""
+
+    cookies: dict[str, dict[str, Any]]  # cookie name -> cookie metadata
+    values: dict[str, str]  # cookie name -> value, precomputed at write time
+    expiry: float  # cf_clearance expiry (epoch seconds, inf for session cookies)
+    user_agent: str | None = None
+
+
+_cf_sessions: OrderedDict[str, _CFSession] = OrderedDict()
 _cf_cookies_lock = threading.Lock()
 
-# User-Agent storage - Cloudflare ties cf_clearance to the UA that solved the challenge
-_cf_user_agents: dict[str, str] = {}
 
 # Protection cookie names we care about (Cloudflare and DDoS-Guard)
 CF_COOKIE_NAMES = {"cf_clearance", "__cf_bm", "cf_chl_2", "cf_chl_prog"}
@@ -243,11 +425,15 @@ DDG_COOKIE_NAMES = {
     "__ddgmark_",
     "ddg_last_challenge",
 }
+_PROTECTION_COOKIE_NAMES = frozenset(CF_COOKIE_NAMES | DDG_COOKIE_NAMES)
+_PROTECTION_COOKIE_PREFIXES = ("cf_", "__ddg")
 
 
+@lru_cache(maxsize=1024)
 def _get_base_domain(domain: str) -> str:
     """Extract base domain from hostname (e.g., 'www.example.com' -> 'example.com')."""
-    return ".".join(domain.split(".")[-2:]) if "." in domain else domain
+    # rfind(".", 0, -1) on a dotless name is -1 too, so the slice keeps it whole.
+    return domain[domain.rfind(".", 0, domain.rfind(".")) + 1 :]
 
 
 def _get_full_cookie_domains() -> set[str]:
@@ -261,24 +447,20 @@ def _should_extract_cookie(name: str, *, extract_all: bool) -> bool:
     """Determine if a cookie should be extracted based on its name."""
     if extract_all:
         return True
-    is_cf = name in CF_COOKIE_NAMES or name.startswith("cf_")
-    is_ddg = name in DDG_COOKIE_NAMES or name.startswith("__ddg")
-    return is_cf or is_ddg
+    return name in _PROTECTION_COOKIE_NAMES or name.startswith(_PROTECTION_COOKIE_PREFIXES)
 
 
 def _store_extracted_cookies(
     *,
-    url: str,
+    hostname: str,
     cookies: list[Any],
     user_agent: str | None = None,
 ) -> None:
-    """Store filtered bypass cookies (and optional UA) for a URL domain."""
-    parsed = urlparse(url)
-    domain = parsed.hostname or ""
-    if not domain:
+    """Store filtered bypass cookies (and optional UA) for a hostname's base domain."""
+    if not hostname:
         return
 
-    base_domain = _get_base_domain(domain)
+    base_domain = _get_base_domain(hostname)
     extract_all = base_domain in _get_full_cookie_domains()
 
     cookies_found: dict[str, dict[str, Any]] = {}
@@ -291,7 +473,7 @@ def _store_extracted_cookies(
             expires = None
         cookies_found[name] = {
             "value": getattr(cookie, "value", ""),
-            "domain": getattr(cookie, "domain", None) or domain,
+            "domain": getattr(cookie, "domain", None) or hostname,
             "path": getattr(cookie, "path", None) or "/",
             "expiry": expires,
             "secure": bool(getattr(cookie, "secure", True)),
@@ -302,60 +484,120 @@ def _store_extracted_cookies(
         return
 
     with _cf_cookies_lock:
-        _cf_cookies[base_domain] = cookies_found
-        if user_agent:
-            _cf_user_agents[base_domain] = user_agent
-            logger.debug("Stored UA for %s: %s...", base_domain, str(user_agent)[:60])
-        else:
-            logger.debug("No UA captured for %s", base_domain)
+        _set_domain_session(base_domain, cookies_found, user_agent or None)
+    if user_agent:
+        logger.debug("Stored UA for %s: %s...", base_domain, str(user_agent)[:60])
+    else:
+        logger.debug("No UA captured for %s", base_domain)
 
     cookie_type = "all" if extract_all else "protection"
     logger.debug("Extracted %s %s cookies for %s", len(cookies_found), cookie_type, base_domain)
 
 
-async def _extract_cookies_from_cdp(driver: Any, page: Any, url: str) -> None:
+async def _get_cookies_for_url(driver: Any, page: Any, url: str) -> list[Any]:
+    """Fetch the cookies that apply to ``url`` with one Network.getCookies call.
+
+    The command is sent on the bypass tab itself: ``driver.cookies.get_all()``
+    queries whichever tab is open first, which for a pooled browser is not the
+    one that solved the challenge. Falls back to ``get_all()`` if the tab can't
+    send CDP commands directly.
+    """
+    try:
+        return await page.send(cdp_network.get_cookies(urls=[url]))
+    except _CDP_OPERATION_ERRORS as e:
+        logger.debug("Network.getCookies on bypass tab failed, using get_all: %s", e)
+    return await driver.cookies.get_all(requests_cookie_format=True)
+
+
+async def _read_user_agent(page: Any) -> str | None:
+    """Return the browser's User-Agent via CDP, or None if it can't be read."""
+    try:
+        user_agent = await page.evaluate("navigator.userAgent")
+    except _CDP_OPERATION_ERRORS:
+        return None
+    return user_agent if isinstance(user_agent, str) and user_agent else None
+
+
+async def _extract_cookies_from_cdp(
+    driver: Any, page: Any, url: str, hostname: str | None = None
+) -> None:
     """Extract cookies from a CDP browser after successful bypass."""
+    if hostname is None:
+        hostname = urlparse(url).hostname or ""
     try:
         try:
-            all_cookies = await driver.cookies.get_all(requests_cookie_format=True)
+            all_cookies = await _get_cookies_for_url(driver, page, url)
         except _CDP_OPERATION_ERRORS as e:
             logger.debug("Failed to get cookies via CDP: %s", e)
             return
 
-        try:
-            user_agent = await page.evaluate("navigator.userAgent")
-        except _CDP_OPERATION_ERRORS:
-            user_agent = None
+        # The UA is fixed for a browser's lifetime; it's captured at launch.
+        user_agent = getattr(driver, _DRIVER_USER_AGENT_ATTR, None) or await _read_user_agent(page)
 
-        _store_extracted_cookies(url=url, cookies=all_cookies, user_agent=user_agent)
+        _store_extracted_cookies(hostname=hostname, cookies=all_cookies, user_agent=user_agent)
 
     except _CDP_OPERATION_ERRORS as e:
         logger.debug("Failed to extract cookies: %s", e)
 
 
-def get_cf_cookies_for_domain(domain: str) -> dict[str, str]:
-    """Get stored cookies for a domain. Returns empty dict if none available."""
+def _clearance_expiry(cookies: dict[str, dict[str, Any]]) -> float:
+    """Return the cf_clearance expiry as epoch seconds, or inf if it never expires."""
+    cf_clearance = cookies.get("cf_clearance") or {}
+    expiry = cf_clearance.get("expiry")
+    if expiry is None:
+        expiry = cf_clearance.get("expires")
+    return float(expiry) if expiry and expiry > 0 else math.inf
+
+
+def _set_domain_session(
+    base_domain: str, cookies: dict[str, dict[str, Any]], user_agent: str | None
+) -> None:
+    """Store a domain's cookies together with their UA. Caller holds _cf_cookies_lock."""
+    _sweep_expired_cookies()
+    _cf_sessions[base_domain] = _CFSession(
+        cookies=cookies,
+        values={name: c["value"] for name, c in cookies.items()},
+        expiry=_clearance_expiry(cookies),
+        user_agent=user_agent,
+    )
+    _cf_sessions.move_to_end(base_domain)
+    while len(_cf_sessions) > _CF_MAX_DOMAINS:
+        _cf_sessions.popitem(last=False)
+
+
+def _sweep_expired_cookies() -> None:
+    """Drop every domain whose cf_clearance has expired. Caller holds _cf_cookies_lock."""
+    now = time.time()
+    for base_domain in [domain for domain, entry in _cf_sessions.items() if now > entry.expiry]:
+        logger.debug("CF cookies expired for %s", base_domain)
+        del _cf_sessions[base_domain]
+
+
+def get_cf_session_for_domain(domain: str) -> tuple[dict[str, str], str | None]:
+    """Get stored cookies and the bypass User-Agent for a domain in one store read.
+
+    Cookies are an empty dict when none are available or they have expired.
+    """
     if not domain:
-        return {}
+        return {}, None
 
     base_domain = _get_base_domain(domain)
 
+    # A hit refreshes the domain's LRU position, so this takes the lock too;
+    # expired domains are left for the sweep on the next write.
     with _cf_cookies_lock:
-        cookies = _cf_cookies.get(base_domain, {})
-        if not cookies:
-            return {}
+        entry = _cf_sessions.get(base_domain)
+        if entry is None:
+            return {}, None
+        if time.time() > entry.expiry:
+            return {}, entry.user_agent
+        _cf_sessions.move_to_end(base_domain)
+        return dict(entry.values), entry.user_agent
 
-        cf_clearance = cookies.get("cf_clearance", {})
-        if cf_clearance:
-            expiry = cf_clearance.get("expiry")
-            if expiry is None:
-                expiry = cf_clearance.get("expires")
-            if expiry and expiry > 0 and time.time() > expiry:
-                logger.debug("CF cookies expired for %s", base_domain)
-                _cf_cookies.pop(base_domain, None)
-                return {}
 
-        return {name: c["value"] for name, c in cookies.items()}
+def get_cf_cookies_for_domain(domain: str) -> dict[str, str]:
+    """Get stored cookies for a domain. Returns empty dict if none available."""
+    return get_cf_session_for_domain(domain)[0]
 
 
 def has_valid_cf_cookies(domain: str) -> bool:
@@ -368,69 +610,106 @@ def get_cf_user_agent_for_domain(domain: str) -> str | None:
     if not domain:
         return None
     with _cf_cookies_lock:
-        return _cf_user_agents.get(_get_base_domain(domain))
+        entry = _cf_sessions.get(_get_base_domain(domain))
+        return entry.user_agent if entry is not None else None
 
 
 def clear_cf_cookies(domain: str | None = None) -> None:
     """Clear stored Cloudflare cookies and User-Agent. If domain is None, clear all."""
     with _cf_cookies_lock:
         if domain:
-            base_domain = _get_base_domain(domain)
-            _cf_cookies.pop(base_domain, None)
-            _cf_user_agents.pop(base_domain, None)
+            _cf_sessions.pop(_get_base_domain(domain), None)
         else:
-            _cf_cookies.clear()
-            _cf_user_agents.clear()
+            _cf_sessions.clear()
+
+
+def _read_parent_pid(proc_path: str) -> int | None:
+    """Return the parent PID from a ``/proc/<pid>/stat`` entry, or None if unreadable."""
+    try:
+        stat_bytes = Path(proc_path, "stat").read_bytes()
+        # The command name may contain spaces or parens; fields resume after the last ")"
+        return int(stat_bytes.rsplit(b")", 1)[1].split()[1])
+    except OSError, IndexError, ValueError:
+        return None
+
+
+def _find_orphan_processes(root_pid: int | None = None) -> dict[int, bytes]:
+    """Map PIDs whose command line mentions a browser-stack process to that name.
+
+    Matches the command line like ``pgrep -f`` by walking ``/proc`` directly
+    instead of spawning pgrep/pkill for each process name. With ``root_pid``,
+    only descendants of that process are returned.
+    """
+    own_pid = os.getpid()
+    orphans: dict[int, bytes] = {}
+    try:
+        entries = list(os.scandir(_PROC_DIR))
+    except OSError as e:
+        logger.debug("Could not list /proc: %s", e)
+        return orphans
+
+    parents: dict[int, int | None] = {}
+    for entry in entries:
+        if not entry.name.isdigit() or int(entry.name) == own_pid:
+            continue
+        try:
+            cmdline = Path(entry.path, "cmdline").read_bytes()
+        except OSError:
+            continue
+        if root_pid is not None:
+            parents[int(entry.name)] = _read_parent_pid(entry.path)
+        for proc_name in _ORPHAN_PROCESS_NAMES:
+            if proc_name in cmdline:
+                orphans[int(entry.name)] = proc_name
+                break
+
+    if root_pid is None:
+        return orphans
+
+    def _descends_from_root(pid: int) -> bool:
+        seen: set[int] = set()
+        parent = parents.get(pid)
+        while parent is not None and parent not in seen:
+            if parent == root_pid:
+                return True
+            seen.add(parent)
+            parent = parents.get(parent)
+        return False
+
+    return {pid: name for pid, name in orphans.items() if _descends_from_root(pid)}
 
 
 def _cleanup_orphan_processes() -> int:
-    """Kill orphan Chrome/Xvfb/ffmpeg processes. Only runs in Docker mode."""
+    """Kill orphan Chrome/Xvfb/ffmpeg processes. Only runs in Docker mode.
+
+    A Docker helper subprocess only sweeps its own process tree, since sibling
+    helpers for other domains may be running their browsers at the same time.
+    """
     if not env.DOCKERMODE:
         return 0
 
     _stop_ffmpeg_recording()
 
-    processes_to_kill = ["chrome", "chromium", "Xvfb", "ffmpeg"]
-    total_killed = 0
-
     logger.debug("Checking for orphan processes...")
     logger.log_resource_usage()
 
-    if _PGREP_PATH is None or _PKILL_PATH is None:
-        logger.warning("Skipping orphan-process cleanup because pgrep/pkill are unavailable")
-        return 0
-
-    for proc_name in processes_to_kill:
-        try:
-            result = subprocess.run(
-                [_PGREP_PATH, "-f", proc_name],
-                capture_output=True,
-                check=False,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode != 0 or not result.stdout.strip():
+    in_helper = os.environ.get(_BYPASS_CHILD_ENV) == "1"
+    orphans = _find_orphan_processes(os.getpid() if in_helper else None)
+    total_killed = 0
+    for proc_name in _ORPHAN_PROCESS_NAMES:
+        pids = [pid for pid, name in orphans.items() if name == proc_name]
+        if not pids:
+            continue
+        logger.info("Found %s orphan %s process(es), killing...", len(pids), proc_name.decode())
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
                 continue
-
-            pids = result.stdout.strip().split("\n")
-            count = len(pids)
-            logger.info("Found %s orphan %s process(es), killing...", count, proc_name)
-
-            kill_result = subprocess.run(
-                [_PKILL_PATH, "-9", "-f", proc_name],
-                capture_output=True,
-                check=False,
-                timeout=5,
-            )
-            if kill_result.returncode == 0:
-                total_killed += count
-            else:
-                logger.warning("pkill for %s returned %s", proc_name, kill_result.returncode)
-
-        except subprocess.TimeoutExpired:
-            logger.warning("Timeout while checking for %s processes", proc_name)
-        except _SUBPROCESS_OPERATION_ERRORS as e:
-            logger.debug("Error checking for %s processes: %s", proc_name, e)
+            except OSError as e:
+                logger.debug("Could not kill %s process %s: %s", proc_name.decode(), pid, e)
+                continue
+            total_killed += 1
 
     if total_killed > 0:
         time.sleep(1)
@@ -443,29 +722,21 @@ def _cleanup_orphan_processes() -> int:
 
 
 async def _get_page_info(page: Any) -> tuple[str, str, str]:
-    """Extract page title, body text, and current URL safely."""
-    try:
-        title = (await page.get_title() or "").lower()
-    except _CDP_OPERATION_ERRORS:
-        title = ""
-    try:
-        body = await page.evaluate("document.body ? document.body.innerText : ''")
-        body = (body or "").lower()
-    except _CDP_OPERATION_ERRORS:
-        body = ""
+    """Extract page title, body text, and current URL safely in one CDP call."""
     try:
-        current_url = await page.get_current_url() or ""
+        info = await page.evaluate(_PAGE_INFO_SCRIPT)
     except _CDP_OPERATION_ERRORS:
-        current_url = ""
-    return title, body, current_url
+        return "", "", ""
+    if not isinstance(info, list) or len(info) != _PAGE_INFO_FIELDS:
+        return "", "", ""
+    title, body, current_url = (part if isinstance(part, str) else "" for part in info)
+    return title.lower(), body.lower(), current_url
 
 
-def _check_indicators(title: str, body: str, indicators: list[str]) -> str | None:
+def _check_indicators(title: str, body: str, pattern: re.Pattern[str]) -> str | None:
     """Check if any indicator is present in title or body. Returns the found indicator or None."""
-    for indicator in indicators:
-        if indicator in title or indicator in body:
-            return indicator
-    return None
+    match = pattern.search(title) or pattern.search(body)
+    return match.group() if match else None
 
 
 def _has_cloudflare_patterns(body: str, url: str) -> bool:
@@ -478,12 +749,12 @@ async def _detect_challenge_type(page: Any) -> str:
     title, body, current_url = await _get_page_info(page)
 
     # DDOS-Guard indicators
-    if found := _check_indicators(title, body, DDOS_GUARD_INDICATORS):
+    if found := _check_indicators(title, body, _DDOS_GUARD_PATTERN):
         logger.debug("DDOS-Guard indicator found: '%s'", found)
         return "ddos_guard"
 
     # Cloudflare indicators
-    if found := _check_indicators(title, body, CLOUDFLARE_INDICATORS):
+    if found := _check_indicators(title, body, _CLOUDFLARE_PATTERN):
         logger.debug("Cloudflare indicator found: '%s'", found)
         return "cloudflare"
 
@@ -497,23 +768,25 @@ async def _detect_challenge_type(page: Any) -> str:
 async def _is_bypassed(page: Any, *, escape_emojis: bool = True) -> bool:
     """Check if the protection has been bypassed."""
     title, body, current_url = await _get_page_info(page)
-    body_len = len(body.strip())
+    body_len = len(body)
 
     # Long page content = probably bypassed
     if body_len > _BYPASSED_BODY_LENGTH_MIN:
-        logger.debug("Page content too long, probably bypassed (len: %s)", body_len)
+        logger.debug(
+            "Page content too long, probably bypassed (len: >%s)", _BYPASSED_BODY_LENGTH_MIN
+        )
         return True
 
     # Multiple emojis = probably real content
     if escape_emojis:
-        import emoji
-
-        if len(emoji.emoji_list(body)) >= _BYPASS_EMOJI_MATCH_MIN:
+        # Stop scanning once enough emojis are found instead of listing them all.
+        emojis = islice(emoji.analyze(body), _BYPASS_EMOJI_MATCH_MIN)
+        if sum(1 for _ in emojis) >= _BYPASS_EMOJI_MATCH_MIN:
             logger.debug("Detected emojis in page, probably bypassed")
             return True
 
     # Check for protection indicators (means NOT bypassed)
-    if _check_indicators(title, body, CLOUDFLARE_INDICATORS + DDOS_GUARD_INDICATORS):
+    if _check_indicators(title, body, _PROTECTION_PATTERN):
         return False
 
     # Cloudflare URL patterns
@@ -668,6 +941,71 @@ BYPASS_METHODS = [
 
 MAX_CONSECUTIVE_SAME_CHALLENGE = 3
 
+# (challenge type, method name) -> (successes, attempts). Docker helper subprocesses
+# are seeded with the parent's stats and report their own attempts back to it.
+_METHOD_STATS: dict[tuple[str, str], tuple[int, int]] = {}
+_METHOD_STATS_LOCK = _NATIVE_LOCK()
+
+
+def _pick_bypass_method(challenge_type: str, tried: set[str]) -> Callable[[Any], Awaitable[bool]]:
+    """Pick the untried bypass method most likely to solve this challenge type.
+
+    Methods are ranked by the smoothed success rate (successes + 1) / (attempts + 2),
+    so unseen methods start at 0.5 and ties keep BYPASS_METHODS order. Each method
+    is tried once before any repeats, which preserves a full pass per challenge.
+    """
+    candidates = [m for m in BYPASS_METHODS if m.__name__ not in tried] or BYPASS_METHODS
+
+    with _METHOD_STATS_LOCK:
+
+        def _score(method: Callable[[Any], Awaitable[bool]]) -> float:
+            successes, attempts = _METHOD_STATS.get((challenge_type, method.__name__), (0, 0))
+            return (successes + 1) / (attempts + 2)
+
+        return max(candidates, key=_score)
+
+
+def _record_bypass_result(
+    challenge_type: str, method: Callable[[Any], Awaitable[bool]], *, succeeded: bool
+) -> None:
+    """Update the success statistics used by _pick_bypass_method."""
+    key = (challenge_type, method.__name__)
+    with _METHOD_STATS_LOCK:
+        successes, attempts = _METHOD_STATS.get(key, (0, 0))
+        _METHOD_STATS[key] = (successes + int(succeeded), attempts + 1)
+
+
+def _method_stats_since(
+    baseline: dict[tuple[str, str], tuple[int, int]] | None = None,
+) -> list[list[Any]]:
+    """Serialize stats gained since ``baseline`` as [challenge, method, successes, attempts]."""
+    baseline = baseline or {}
+    with _METHOD_STATS_LOCK:
+        rows = []
+        for key, (successes, attempts) in _METHOD_STATS.items():
+            base_successes, base_attempts = baseline.get(key, (0, 0))
+            if attempts > base_attempts:
+                rows.append([*key, successes - base_successes, attempts - base_attempts])
+        return rows
+
+
+def _merge_method_stats(rows: object) -> None:
+    """Add rows produced by _method_stats_since into _METHOD_STATS."""
+    if not isinstance(rows, list):
+        return
+    with _METHOD_STATS_LOCK:
+        for row in rows:
+            try:
+                challenge_type, method_name, successes, attempts = row
+                key = (str(challenge_type), str(method_name))
+                prev_successes, prev_attempts = _METHOD_STATS.get(key, (0, 0))
+                _METHOD_STATS[key] = (
+                    prev_successes + int(successes),
+                    prev_attempts + int(attempts),
+                )
+            except TypeError, ValueError:
+                continue
+
 
 def _check_cancellation(cancel_flag: Event | None, message: str) -> None:
     """Check if cancellation was requested and raise if so."""
@@ -677,6 +1015,23 @@ def _check_cancellation(cancel_flag: Event | None, message: str) -> None:
         raise BypassCancelledError(msg)
 
 
+async def _sleep_with_cancellation(seconds: float, cancel_flag: Event | None) -> None:
+    """Sleep on the CDP loop, raising BypassCancelledError soon after cancellation.
+
+    cancel_flag is a (possibly gevent-patched) threading.Event set from another
+    thread, so it can't be awaited directly; poll it in short steps instead.
+    """
+    if cancel_flag is None:
+        await asyncio.sleep(seconds)
+        return
+
+    deadline = time.monotonic() + seconds
+    while (remaining := deadline - time.monotonic()) > 0:
+        _check_cancellation(cancel_flag, "Bypass cancelled during wait")
+        await asyncio.sleep(min(_CANCEL_POLL_SECONDS, remaining))
+    _check_cancellation(cancel_flag, "Bypass cancelled during wait")
+
+
 async def _bypass(
     page: Any, max_retries: int | None = None, cancel_flag: Event | None = None
 ) -> bool:
@@ -687,6 +1042,7 @@ async def _bypass(
 
     last_challenge_type = None
     consecutive_same_challenge = 0
+    tried_methods: set[str] = set()
     # Allow at least one full pass through all bypass methods before aborting due to a "stuck" challenge.
     min_same_challenge_before_abort = max(MAX_CONSECUTIVE_SAME_CHALLENGE, len(BYPASS_METHODS) + 1)
 
@@ -731,25 +1087,29 @@ async def _bypass(
             consecutive_same_challenge = 1
         last_challenge_type = challenge_type
 
-        method = BYPASS_METHODS[try_count % len(BYPASS_METHODS)]
+        if len(tried_methods) >= len(BYPASS_METHODS):
+            tried_methods.clear()
+        method = _pick_bypass_method(challenge_type, tried_methods)
+        tried_methods.add(method.__name__)
         logger.info("Bypass attempt %s/%s using %s", try_count + 1, max_retries, method.__name__)
 
         if try_count > 0:
             wait_time = min(_RNG.uniform(2, 4) * try_count, 12)
             logger.info("Waiting %0.1fs before trying...", wait_time)
-            for _ in range(int(wait_time)):
-                _check_cancellation(cancel_flag, "Bypass cancelled during wait")
-                await asyncio.sleep(1)
-            await asyncio.sleep(wait_time - int(wait_time))
+            await _sleep_with_cancellation(wait_time, cancel_flag)
 
         try:
-            if await method(page):
-                logger.info("Bypass successful using %s", method.__name__)
-                return True
+            succeeded = bool(await method(page))
         except BypassCancelledError:
             raise
         except _CDP_OPERATION_ERRORS as e:
             logger.warning("Exception in %s: %s", method.__name__, e)
+            succeeded = False
+
+        _record_bypass_result(challenge_type, method, succeeded=succeeded)
+        if succeeded:
+            logger.info("Bypass successful using %s", method.__name__)
+            return True
 
         logger.info("Bypass method %s failed.", method.__name__)
 
@@ -757,28 +1117,34 @@ async def _bypass(
     return False
 
 
+_BASE_BROWSER_ARGS = (
+    "--ignore-certificate-errors",
+    "--ignore-ssl-errors",
+    "--allow-running-insecure-content",
+    "--ignore-certificate-errors-spki-list",
+    "--ignore-certificate-errors-skip-list",
+    # Chrome 144+ disabled automatic SwiftShader fallback for WebGL (security reasons).
+    # Without this flag, WebGL is broken in headless/Docker which triggers bot detection.
+    # See: https://issues.chromium.org/issues/40277080
+    "--enable-unsafe-swiftshader",
+)
+_DEBUG_BROWSER_ARGS = (
+    "--enable-logging",
+    "--v=1",
+    "--log-file=" + str(LOG_DIR / "chrome_browser.log"),
+)
+
+
 def _get_browser_args() -> list[str]:
     """Build extra Chrome arguments, pre-resolving hostnames via patched DNS.
 
     Pre-resolves AA hostnames and passes IPs to Chrome via --host-resolver-rules,
     bypassing Chrome's DNS entirely for those hosts.
     """
-    arguments = [
-        "--ignore-certificate-errors",
-        "--ignore-ssl-errors",
-        "--allow-running-insecure-content",
-        "--ignore-certificate-errors-spki-list",
-        "--ignore-certificate-errors-skip-list",
-        # Chrome 144+ disabled automatic SwiftShader fallback for WebGL (security reasons).
-        # Without this flag, WebGL is broken in headless/Docker which triggers bot detection.
-        # See: https://issues.chromium.org/issues/40277080
-        "--enable-unsafe-swiftshader",
-    ]
+    arguments: list[str] = list(_BASE_BROWSER_ARGS)
 
     if app_config.get("DEBUG", False):
-        arguments.extend(
-            ["--enable-logging", "--v=1", "--log-file=" + str(LOG_DIR / "chrome_browser.log")]
-        )
+        arguments.extend(_DEBUG_BROWSER_ARGS)
 
     host_rules = _build_host_resolver_rules()
     if host_rules:
@@ -790,16 +1156,61 @@ def _get_browser_args() -> list[str]:
     return arguments
 
 
+# Last resolved host rules: (hostnames, rules, resolved_at monotonic time).
+_host_rules_cache: tuple[tuple[str, ...], list[str], float] | None = None
+_host_rules_lock = _NATIVE_LOCK()
+
+
+def _invalidate_host_resolver_rules(*_args: object) -> None:
+    """Drop cached host resolver rules (e.g. after a DNS rotation)."""
+    global _host_rules_cache
+    with _host_rules_lock:
+        _host_rules_cache = None
+
+
+network.register_dns_rotation_callback(_invalidate_host_resolver_rules)
+
+
 def _build_host_resolver_rules() -> list[str]:
-    """Pre-resolve AA hostnames and build Chrome host resolver rules."""
-    host_rules = []
+    """Pre-resolve AA hostnames and build Chrome host resolver rules.
 
+    Results are reused for ``_HOST_RULES_TTL_SECONDS`` so each browser launch
+    does not repeat a blocking lookup per mirror on the CDP worker loop.
+    """
+    global _host_rules_cache
     try:
-        for url in network.get_available_aa_urls():
-            hostname = urlparse(url).hostname
-            if not hostname:
-                continue
+        hostnames = tuple(
+            hostname
+            for url in network.get_available_aa_urls()
+            if (hostname := urlparse(url).hostname)
+        )
+    except (OSError, RuntimeError, TypeError, ValueError) as e:
+        logger.error_trace(f"Error pre-resolving hostnames for Chrome: {e}")
+        return []
+
+    with _host_rules_lock:
+        cached = _host_rules_cache
+    if (
+        cached is not None
+        and cached[0] == hostnames
+        and time.monotonic() - cached[2] < _HOST_RULES_TTL_SECONDS
+    ):
+        return list(cached[1])
+
+    host_rules = _resolve_host_rules(hostnames)
+    # Don't pin a failed lookup for the whole TTL; retry on the next launch.
+    if host_rules:
+        with _host_rules_lock:
+            _host_rules_cache = (hostnames, host_rules, time.monotonic())
+    return list(host_rules)
+
+
+def _resolve_host_rules(hostnames: tuple[str, ...]) -> list[str]:
+    """Resolve each hostname to an IPv4 address as a Chrome ``MAP`` rule."""
+    host_rules = []
 
+    try:
+        for hostname in hostnames:
             try:
                 results = socket.getaddrinfo(hostname, 443, socket.AF_INET)
                 if results:
@@ -819,14 +1230,37 @@ def _build_host_resolver_rules() -> list[str]:
 DRIVER_RESET_ERRORS = {"ProtocolException", "RuntimeError", "TimeoutError"}
 
 
-async def _get(url: str, driver: Any, cancel_flag: Event | None = None) -> str:
+async def _get(
+    url: str,
+    driver: Any,
+    cancel_flag: Event | None = None,
+    *,
+    hostname: str,
+    new_tab: bool = False,
+) -> str:
     """Fetch URL with Cloudflare bypass using a CDP browser."""
     _check_cancellation(cancel_flag, "Bypass cancelled before starting")
 
     logger.debug("CDP_GET: %s", url)
 
     logger.debug("Opening URL with SeleniumBase CDP...")
-    page = await driver.get(url)
+    page = await driver.get(url, new_tab=new_tab)
+    if not new_tab:
+        return await _bypass_page(url, hostname, driver, page, cancel_flag)
+
+    # Pooled browsers get a fresh tab per bypass; close it so the next
+    # checkout starts from a clean page.
+    try:
+        return await _bypass_page(url, hostname, driver, page, cancel_flag)
+    finally:
+        with suppress(*_CDP_OPERATION_ERRORS):
+            await page.close()
+
+
+async def _bypass_page(
+    url: str, hostname: str, driver: Any, page: Any, cancel_flag: Event | None
+) -> str:
+    """Run the bypass on a loaded page and return its HTML, or "" on failure."""
     with suppress(Exception):
         await page.wait()
 
@@ -841,12 +1275,14 @@ async def _get(url: str, driver: Any, cancel_flag: Event | None = None) -> str:
 
     logger.debug("Starting bypass process...")
     if await _bypass(page, cancel_flag=cancel_flag):
-        await _extract_cookies_from_cdp(driver, page, url)
+        await _extract_cookies_from_cdp(driver, page, url, hostname)
         return await page.get_page_source()
 
     logger.warning("Bypass completed but page still shows protection")
     try:
-        body = await page.evaluate("document.body ? document.body.innerText : ''")
+        body = await page.evaluate(
+            f"document.body ? document.body.innerText.slice(0, {_PAGE_BODY_PREVIEW_CHARS + 1}) : ''"
+        )
         if body:
             preview = body
             if len(body) > _PAGE_BODY_PREVIEW_CHARS:
@@ -858,20 +1294,31 @@ async def _get(url: str, driver: Any, cancel_flag: Event | None = None) -> str:
     return ""
 
 
-def _run_bypass_in_current_process(url: str, retry: int, cancel_flag: Event | None = None) -> str:
+def _run_bypass_in_current_process(
+    url: str, retry: int, cancel_flag: Event | None = None, *, hostname: str | None = None
+) -> str:
     """Run the CDP bypass in the current process."""
+    if hostname is None:
+        hostname = urlparse(url).hostname or ""
+    # The Docker helper subprocess runs a single bypass on a throwaway loop, so
+    # only the long-lived CDP worker keeps browsers warm between calls.
+    use_pool = os.environ.get(_BYPASS_CHILD_ENV) != "1"
 
     async def _run_bypass() -> str:
         driver = None
+        succeeded = False
         try:
-            driver = await _create_cdp_browser(url)
+            driver = await (_BROWSER_POOL.acquire(url) if use_pool else _create_cdp_browser(url))
 
             for attempt in range(retry):
                 _check_cancellation(cancel_flag, "Bypass cancelled before attempt")
 
                 try:
-                    result = await _get(url, driver, cancel_flag)
+                    result = await _get(
+                        url, driver, cancel_flag, hostname=hostname, new_tab=use_pool
+                    )
                     if result:
+                        succeeded = True
                         return result
                 except BypassCancelledError:
                     raise
@@ -886,31 +1333,61 @@ def _run_bypass_in_current_process(url: str, retry: int, cancel_flag: Event | No
                     if type(e).__name__ in DRIVER_RESET_ERRORS:
                         logger.info("Restarting Chrome due to browser error...")
                         await _close_cdp_driver(driver)
+                        driver = None
                         driver = await _create_cdp_browser(url)
 
             logger.error("Bypass failed after %s attempts", retry)
             return ""
         finally:
-            if driver:
+            # Only a browser that just cleared a page goes back to the pool; one
+            # left on a challenge, cancelled mid-run or in a broken CDP state is closed.
+            if driver and use_pool and succeeded:
+                await _BROWSER_POOL.release(driver, url)
+            elif driver:
                 await _close_cdp_driver(driver)
 
-    if os.environ.get(_BYPASS_CHILD_ENV) == "1":
+    if not use_pool:
         return asyncio.run(_run_bypass())
     return _CDP_WORKER.run(_run_bypass())
 
 
+def _close_pooled_browsers() -> None:
+    """Close warm browsers at interpreter exit so Chrome is not left orphaned."""
+    if not _CDP_WORKER.is_running():
+        return
+    with suppress(Exception):
+        _CDP_WORKER.run(_BROWSER_POOL.close_all(), timeout=_BROWSER_START_TIMEOUT_SECONDS)
+
+
+atexit.register(_close_pooled_browsers)
+
+
 def _store_child_bypass_state(payload: dict[str, Any]) -> None:
     cookies = payload.get("cookies")
-    if isinstance(cookies, dict):
-        with _cf_cookies_lock:
-            _cf_cookies.update(cookies)
-
+    if not isinstance(cookies, dict):
+        return
     user_agents = payload.get("user_agents")
-    if isinstance(user_agents, dict):
-        with _cf_cookies_lock:
-            _cf_user_agents.update(
-                {str(domain): str(agent) for domain, agent in user_agents.items()}
-            )
+    if not isinstance(user_agents, dict):
+        user_agents = {}
+
+    with _cf_cookies_lock:
+        for base_domain, domain_cookies in cookies.items():
+            if isinstance(domain_cookies, dict):
+                agent = user_agents.get(base_domain)
+                _set_domain_session(str(base_domain), domain_cookies, str(agent) if agent else None)
+
+
+def _child_bypass_state() -> dict[str, dict[str, Any]]:
+    """Serialize the cookie store for the parent process (see _store_child_bypass_state)."""
+    with _cf_cookies_lock:
+        return {
+            "cookies": {domain: entry.cookies for domain, entry in _cf_sessions.items()},
+            "user_agents": {
+                domain: entry.user_agent
+                for domain, entry in _cf_sessions.items()
+                if entry.user_agent
+            },
+        }
 
 
 def _prepare_child_browser_env(env_vars: dict[str, str]) -> dict[str, str]:
@@ -935,7 +1412,26 @@ def _prepare_child_browser_env(env_vars: dict[str, str]) -> dict[str, str]:
 
 def _get_via_subprocess(url: str, retry: int, cancel_flag: Event | None = None) -> str:
     """Run the browser bypass in a helper process isolated from gunicorn/gevent."""
+    global _active_helpers
     _check_cancellation(cancel_flag, "Bypass cancelled before helper process")
+    with LOCKED:
+        _active_helpers += 1
+    failed = True
+    try:
+        html = _run_helper_process(url, retry)
+        failed = False
+        return html
+    finally:
+        with LOCKED:
+            _active_helpers -= 1
+            # A killed or crashed helper can leave its browser reparented outside
+            # its own tree; sweep machine-wide once no sibling helper is running.
+            if failed and not _active_helpers:
+                _cleanup_orphan_processes()
+
+
+def _run_helper_process(url: str, retry: int) -> str:
+    """Spawn one helper subprocess for ``url`` and return the HTML it fetched."""
     result_path = (
         Path(tempfile.gettempdir()) / f"shelfmark-bypass-{os.getpid()}-{time.time_ns()}.json"
     )
@@ -949,6 +1445,7 @@ def _get_via_subprocess(url: str, retry: int, cancel_flag: Event | None = None)
         "retry": retry,
         "result_path": str(result_path),
         "dns_config": network.get_dns_config(),
+        "method_stats": _method_stats_since(),
     }
     env_vars = os.environ.copy()
     env_vars[_BYPASS_CHILD_ENV] = "1"
@@ -981,6 +1478,9 @@ def _get_via_subprocess(url: str, retry: int, cancel_flag: Event | None = None)
         msg = "Internal bypasser helper returned an invalid result"
         raise TypeError(msg)
 
+    # The helper's _bypass attempts count towards method ranking whether or not it succeeded
+    _merge_method_stats(result.get("method_stats"))
+
     if not result.get("ok"):
         error_type = result.get("error_type", "RuntimeError")
         error = result.get("error", "Internal bypasser helper failed")
@@ -995,19 +1495,55 @@ def _get_via_subprocess(url: str, retry: int, cancel_flag: Event | None = None)
     return html if isinstance(html, str) else ""
 
 
-def get(url: str, retry: int | None = None, cancel_flag: Event | None = None) -> str:
-    """Fetch a URL with protection bypass. Creates fresh Chrome instance for each bypass."""
+def get(
+    url: str,
+    retry: int | None = None,
+    cancel_flag: Event | None = None,
+    *,
+    tried_cookies: dict[str, str] | None = None,
+) -> str:
+    """Fetch a URL with protection bypass, one bypass at a time per base domain.
+
+    ``tried_cookies`` is the cookie set the caller already retried without success;
+    the in-lock cached-cookie retry is skipped unless the store has changed since.
+    """
     retry = retry if retry is not None else _coerce_positive_int(app_config.MAX_RETRY, 10)
 
-    with LOCKED:
+    hostname = urlparse(url).hostname or ""
+    with _domain_lock(hostname):
         # Try cookies first - another request may have completed bypass while waiting
-        cached_result = _try_with_cached_cookies(url, urlparse(url).hostname or "")
-        if cached_result:
-            return cached_result
+        session = get_cf_session_for_domain(hostname)
+        if session[0] and session[0] != tried_cookies:
+            cached_result = _try_with_cached_cookies(url, hostname, session)
+            if cached_result:
+                return cached_result
 
         if env.DOCKERMODE and os.environ.get(_BYPASS_CHILD_ENV) != "1":
             return _get_via_subprocess(url, retry, cancel_flag)
-        return _run_bypass_in_current_process(url, retry, cancel_flag)
+        return _run_bypass_in_current_process(url, retry, cancel_flag, hostname=hostname)
+
+
+@contextmanager
+def _domain_lock(hostname: str) -> Iterator[None]:
+    """Hold the bypass lock shared by every host under the same base domain.
+
+    The entry is dropped once no caller holds or waits on it, so _domain_locks
+    never outgrows the set of domains with a bypass in progress.
+    """
+    base_domain = _get_base_domain(hostname)
+    with _domain_locks_lock:
+        entry = _domain_locks.get(base_domain)
+        if entry is None:
+            entry = _domain_locks[base_domain] = _DomainLock()
+        entry.users += 1
+    try:
+        with entry.lock:
+            yield
+    finally:
+        with _domain_locks_lock:
+            entry.users -= 1
+            if not entry.users:
+                del _domain_locks[base_domain]
 
 
 def _get_proxy_string(url: str) -> str | None:
@@ -1075,9 +1611,10 @@ async def _create_cdp_browser(url: str) -> Any:
         except _CDP_OPERATION_ERRORS as e:
             logger.debug("Failed to set window size: %s", e)
 
-    # Start FFmpeg recording if debug mode (record each bypass session)
-    if app_config.get("DEBUG", False) and not DISPLAY.get("ffmpeg"):
-        _start_ffmpeg_recording(display=os.environ.get("DISPLAY", ":0"))
+    if (page := getattr(driver, "page", None)) is not None:
+        setattr(driver, _DRIVER_USER_AGENT_ATTR, await _read_user_agent(page))
+
+    _start_debug_recording(driver)
 
     await asyncio.sleep(_coerce_non_negative_float(app_config.DEFAULT_SLEEP, 5.0))
     logger.info("Chrome browser ready (Pure CDP)")
@@ -1092,7 +1629,7 @@ async def _close_cdp_driver(driver: Any) -> None:
 
     logger.debug("Quitting Chrome browser (CDP)...")
 
-    _stop_ffmpeg_recording()
+    await _stop_driver_recording(driver)
 
     try:
         connections = []
@@ -1148,6 +1685,76 @@ async def _close_websocket_connection(conn: Any) -> None:
         logger.debug("Failed to close websocket connection: %s", e)
 
 
+def _start_debug_recording(driver: Any) -> None:
+    """Start FFmpeg recording of the bypass session if debug mode is on.
+
+    Only one recorder runs at a time; ``driver`` is marked as its owner so that
+    concurrent bypasses on other browsers leave it running.
+    """
+    if app_config.get("DEBUG", False) and not DISPLAY.get("ffmpeg"):
+        _start_ffmpeg_recording(display=os.environ.get("DISPLAY", ":0"))
+        setattr(driver, _DRIVER_RECORDING_ATTR, True)
+
+
+async def _stop_driver_recording(driver: Any) -> None:
+    """Stop the debug recording ``driver`` started, without blocking the CDP loop."""
+    if not getattr(driver, _DRIVER_RECORDING_ATTR, False):
+        return
+    setattr(driver, _DRIVER_RECORDING_ATTR, False)
+    proc = _take_ffmpeg_process()
+    if proc is None:
+        return
+    for stop_signal, timeout in _FFMPEG_STOP_STEPS:
+        try:
+            proc.send_signal(stop_signal)
+        except _SUBPROCESS_OPERATION_ERRORS as e:
+            logger.debug("ffmpeg stop (%s): %s", stop_signal.name, e)
+            continue
+        deadline = time.monotonic() + timeout
+        while proc.poll() is None and time.monotonic() < deadline:
+            await asyncio.sleep(_FFMPEG_STOP_POLL_SECONDS)
+        if proc.poll() is not None:
+            logger.debug("Stopped ffmpeg recording")
+            return
+    with suppress(Exception):
+        proc.kill()
+
+
+# Fixed FFmpeg encoder and logging options for debug recordings.
+# Debug clips only need to show what the page did; 10 fps is plenty for that.
+_FFMPEG_FRAMERATE = 10
+_FFMPEG_ENCODER_ARGS = (
+    "-c:v",
+    "libx264",
+    "-preset",
+    "ultrafast",
+    # Keep the encoder from competing with Chrome for every core.
+    "-threads",
+    "2",
+    "-maxrate",
+    "700k",
+    "-bufsize",
+    "1400k",
+    "-crf",
+    "36",
+    "-pix_fmt",
+    "yuv420p",
+    # Screen capture wants low latency, not cel-animation tuning; zerolatency
+    # already disables B-frames and lookahead.
+    "-tune",
+    "zerolatency",
+    "-x264-params",
+    "deblock=-1,-1",
+    "-r",
+    str(_FFMPEG_FRAMERATE),
+    "-an",
+)
+_FFMPEG_QUIET_ARGS = ("-nostats", "-loglevel", "0")
+# (signal, seconds to wait) tried in order before falling back to SIGKILL.
+_FFMPEG_STOP_STEPS = ((signal.SIGINT, 1.0), (signal.SIGTERM, 0.5))
+_FFMPEG_STOP_POLL_SECONDS = 0.05
+
+
 def _start_ffmpeg_recording(display: str) -> None:
     """Start FFmpeg screen recording for debug mode."""
     global DISPLAY
@@ -1164,33 +1771,17 @@ def _start_ffmpeg_recording(display: str) -> None:
         "-y",
         "-f",
         "x11grab",
+        # Grab at the output rate instead of x11grab's ~30 fps default, so
+        # frames that would only be dropped are never captured.
+        "-framerate",
+        str(_FFMPEG_FRAMERATE),
         "-video_size",
         f"{display_width}x{display_height}",
         "-i",
         display,
-        "-c:v",
-        "libx264",
-        "-preset",
-        "ultrafast",
-        "-maxrate",
-        "700k",
-        "-bufsize",
-        "1400k",
-        "-crf",
-        "36",
-        "-pix_fmt",
-        "yuv420p",
-        "-tune",
-        "animation",
-        "-x264-params",
-        "bframes=0:deblock=-1,-1",
-        "-r",
-        "15",
-        "-an",
+        *_FFMPEG_ENCODER_ARGS,
         output_file.as_posix(),
-        "-nostats",
-        "-loglevel",
-        "0",
+        *_FFMPEG_QUIET_ARGS,
     ]
     logger.debug("Starting FFmpeg recording to %s", output_file)
     logger.debug_trace(f"FFmpeg command: {' '.join(ffmpeg_cmd)}")
@@ -1199,47 +1790,66 @@ def _start_ffmpeg_recording(display: str) -> None:
 
 
 def _stop_ffmpeg_recording() -> None:
-    """Stop FFmpeg screen recording if running."""
-    import signal
+    """Stop FFmpeg screen recording if running.
 
-    global DISPLAY
-    proc = DISPLAY.get("ffmpeg")
-    if not proc:
-        return
-    if proc.poll() is not None:
-        logger.debug("FFmpeg already stopped")
-        DISPLAY["ffmpeg"] = None
-        DISPLAY["ffmpeg_output"] = None
+    SIGINT lets FFmpeg finalize the MP4, which normally takes well under a
+    second; escalate to SIGTERM and then SIGKILL so a stuck recorder can't
+    hold up the bypass that is shutting it down.
+    """
+    proc = _take_ffmpeg_process()
+    if proc is None:
         return
-    try:
-        proc.send_signal(signal.SIGINT)
-        proc.wait(timeout=5)
-        logger.debug("Stopped ffmpeg recording")
-    except _SUBPROCESS_OPERATION_ERRORS as e:
-        logger.debug("ffmpeg stop: %s", e)
-        with suppress(Exception):
-            proc.terminate()
-            proc.wait(timeout=2)
+    for stop_signal, timeout in _FFMPEG_STOP_STEPS:
+        try:
+            proc.send_signal(stop_signal)
+            proc.wait(timeout=timeout)
+        except _SUBPROCESS_OPERATION_ERRORS as e:
+            logger.debug("ffmpeg stop (%s): %s", stop_signal.name, e)
+        else:
+            logger.debug("Stopped ffmpeg recording")
+            break
+    else:
         with suppress(Exception):
             proc.kill()
+
+
+def _take_ffmpeg_process() -> subprocess.Popen[bytes] | None:
+    """Detach the running recorder from DISPLAY, returning it if it is still alive."""
+    proc = DISPLAY.get("ffmpeg")
     DISPLAY["ffmpeg"] = None
     DISPLAY["ffmpeg_output"] = None
+    if proc is not None and proc.poll() is not None:
+        logger.debug("FFmpeg already stopped")
+        return None
+    return proc
+
 
+# Keep-alive session for cached-cookie retries so repeat requests to a mirror
+# skip the TCP/TLS handshake. Bypass cookies are passed per request; the jar
+# refuses Set-Cookie so one response can't leak cookies into later requests.
+_CACHED_COOKIE_SESSION = requests.Session()
+_CACHED_COOKIE_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_CACHED_COOKIE_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+_CACHED_COOKIE_SESSION.mount("http://", _CACHED_COOKIE_ADAPTER)
+_CACHED_COOKIE_SESSION.mount("https://", _CACHED_COOKIE_ADAPTER)
+atexit.register(_CACHED_COOKIE_SESSION.close)
 
-def _try_with_cached_cookies(url: str, hostname: str) -> str | None:
+
+def _try_with_cached_cookies(
+    url: str, hostname: str, session: tuple[dict[str, str], str | None] | None = None
+) -> str | None:
     """Attempt request with cached cookies before using Chrome."""
-    cookies = get_cf_cookies_for_domain(hostname)
+    cookies, stored_ua = session if session is not None else get_cf_session_for_domain(hostname)
     if not cookies:
         return None
 
     try:
         headers = {}
-        stored_ua = get_cf_user_agent_for_domain(hostname)
         if stored_ua:
             headers["User-Agent"] = stored_ua
 
         logger.debug("Trying request with cached cookies: %s", url)
-        response = requests.get(
+        response = _CACHED_COOKIE_SESSION.get(
             url,
             cookies=cookies,
             headers=headers,
@@ -1264,12 +1874,13 @@ def get_bypassed_page(
     attempt_url = sel.rewrite(url)
     hostname = urlparse(attempt_url).hostname or ""
 
-    cached_result = _try_with_cached_cookies(attempt_url, hostname)
+    session = get_cf_session_for_domain(hostname)
+    cached_result = _try_with_cached_cookies(attempt_url, hostname, session)
     if cached_result:
         return cached_result
 
     try:
-        response_html = get(attempt_url, cancel_flag=cancel_flag)
+        response_html = get(attempt_url, cancel_flag=cancel_flag, tried_cookies=session[0])
     except BypassCancelledError:
         raise
     except _CDP_OPERATION_ERRORS + _REQUEST_OPERATION_ERRORS:
@@ -1325,13 +1936,17 @@ def _run_child_process() -> int:
     if isinstance(dns_config, dict):
         _apply_parent_dns_config(dns_config)
 
+    _merge_method_stats(request.get("method_stats"))
+    with _METHOD_STATS_LOCK:
+        parent_stats = dict(_METHOD_STATS)
+
     try:
         html = get(url, retry=retry)
         payload = {
             "ok": True,
             "html": html,
-            "cookies": _cf_cookies,
-            "user_agents": _cf_user_agents,
+            "method_stats": _method_stats_since(parent_stats),
+            **_child_bypass_state(),
         }
         result_path.write_text(json.dumps(payload), encoding="utf-8")
     except Exception as exc:  # noqa: BLE001 - helper boundary must serialize failures.
@@ -1340,6 +1955,7 @@ def _run_child_process() -> int:
             "error_type": type(exc).__name__,
             "error": str(exc),
             "traceback": traceback.format_exc(),
+            "method_stats": _method_stats_since(parent_stats),
         }
         result_path.write_text(json.dumps(payload), encoding="utf-8")
         return 1
@@ -4,12 +4,17 @@ import json
 import os
 import shutil
 import tempfile
+import time
 from pathlib import Path
 
+_TRUE_STRINGS = frozenset(("true", "yes", "1", "y"))
+_CONFIG_DIR_WRITABLE_TTL_SECONDS = 60.0
+_config_dir_writable_cache: dict[Path, tuple[float, bool]] = {}
+
 
 def string_to_bool(s: str) -> bool:
     """Convert string to boolean."""
-    return s.lower() in ["true", "yes", "1", "y"]
+    return s.lower() in _TRUE_STRINGS
 
 
 def _read_debug_from_config() -> bool:
@@ -35,13 +40,23 @@ def _read_debug_from_config() -> bool:
 
 
 def _is_sqlite_file(path: Path) -> bool:
-    """Check if a file is a valid SQLite database by reading magic bytes."""
+    """Check if a path is a readable SQLite database by reading its magic bytes.
+
+    Missing files, directories and unreadable paths all fail the open/read and
+    report False, so callers need no separate exists()/is_file() stat calls.
+    O_NONBLOCK keeps a FIFO at the path from blocking the open until a writer
+    appears; it has no effect on regular files.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return False
     try:
-        with path.open("rb") as f:
-            header = f.read(16)
-            return header[:16] == b"SQLite format 3\x00"
-    except OSError, PermissionError:
+        return os.read(fd, 16) == b"SQLite format 3\x00"
+    except OSError:
         return False
+    finally:
+        os.close(fd)
 
 
 def _resolve_cwa_db_path() -> Path | None:
@@ -49,29 +64,31 @@ def _resolve_cwa_db_path() -> Path | None:
     env_path = os.getenv("CWA_DB_PATH")
     if env_path:
         path = Path(env_path)
-        if path.exists() and path.is_file() and _is_sqlite_file(path):
+        if _is_sqlite_file(path):
             return path
 
     # Check default mount path
     default_path = Path("/auth/app.db")
-    if default_path.exists() and default_path.is_file() and _is_sqlite_file(default_path):
+    if _is_sqlite_file(default_path):
         return default_path
 
     return None
 
 
 def _is_config_dir_writable() -> bool:
-    """Check if the config directory exists and is writable."""
-    try:
-        if not CONFIG_DIR.exists() or not CONFIG_DIR.is_dir():
-            return False
-        test_file = CONFIG_DIR / ".write_test"
-        test_file.touch()
-        test_file.unlink()
-    except OSError, PermissionError:
-        return False
-    else:
-        return True
+    """Check if the config directory exists and is writable.
+
+    Cover-cache decisions call this per result, so the answer is cached per path
+    for a short while instead of probing the filesystem every time.
+    """
+    now = time.monotonic()
+    cached = _config_dir_writable_cache.get(CONFIG_DIR)
+    if cached is not None and now - cached[0] < _CONFIG_DIR_WRITABLE_TTL_SECONDS:
+        return cached[1]
+
+    writable = CONFIG_DIR.is_dir() and os.access(CONFIG_DIR, os.W_OK)
+    _config_dir_writable_cache[CONFIG_DIR] = (now, writable)
+    return writable
 
 
 def is_covers_cache_enabled() -> bool:
@@ -157,7 +174,11 @@ ONBOARDING = string_to_bool(os.getenv("ONBOARDING", "true"))
 # Debug: skip specific download sources for testing fallback chains
 # Comma-separated values: aa-fast, aa-slow-nowait, aa-slow-wait, libgen, zlib, welib
 _DEBUG_SKIP_SOURCES_RAW = os.getenv("DEBUG_SKIP_SOURCES", "").strip().lower()
-DEBUG_SKIP_SOURCES = {s.strip() for s in _DEBUG_SKIP_SOURCES_RAW.split(",") if s.strip()}
+DEBUG_SKIP_SOURCES: frozenset[str] = (
+    frozenset(s.strip() for s in _DEBUG_SKIP_SOURCES_RAW.split(",") if s.strip())
+    if _DEBUG_SKIP_SOURCES_RAW
+    else frozenset()
+)
 
 
 # =============================================================================
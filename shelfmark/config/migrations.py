@@ -15,6 +15,17 @@ _DEPRECATED_SETTINGS_RESTRICTION_KEYS = (
     "CWA_RESTRICT_SETTINGS_TO_ADMIN",
     "RESTRICT_SETTINGS_TO_ADMIN",
 )
+# The auth-method-specific key wins when present, then the generic key, then
+# whichever method-specific key was left behind by an earlier auth setup.
+_AUTH_METHOD_RESTRICTION_KEYS = {
+    "proxy": "PROXY_AUTH_RESTRICT_SETTINGS_TO_ADMIN",
+    "cwa": "CWA_RESTRICT_SETTINGS_TO_ADMIN",
+}
+_LEGACY_RESTRICTION_FALLBACK_ORDER = (
+    "RESTRICT_SETTINGS_TO_ADMIN",
+    "PROXY_AUTH_RESTRICT_SETTINGS_TO_ADMIN",
+    "CWA_RESTRICT_SETTINGS_TO_ADMIN",
+)
 
 
 class MigrationLogger(Protocol):
@@ -38,21 +49,14 @@ def _as_bool(value: object) -> bool:
 def _pick_legacy_settings_restriction(config: dict[str, Any]) -> bool | None:
     """Pick the best legacy admin-restriction value to migrate."""
     auth_method = str(config.get("AUTH_METHOD", "")).strip().lower()
+    preferred_key = _AUTH_METHOD_RESTRICTION_KEYS.get(auth_method)
+    candidates = _LEGACY_RESTRICTION_FALLBACK_ORDER
+    if preferred_key is not None:
+        candidates = (preferred_key, *candidates)
 
-    if auth_method == "proxy" and "PROXY_AUTH_RESTRICT_SETTINGS_TO_ADMIN" in config:
-        return _as_bool(config.get("PROXY_AUTH_RESTRICT_SETTINGS_TO_ADMIN"))
-
-    if auth_method == "cwa" and "CWA_RESTRICT_SETTINGS_TO_ADMIN" in config:
-        return _as_bool(config.get("CWA_RESTRICT_SETTINGS_TO_ADMIN"))
-
-    if "RESTRICT_SETTINGS_TO_ADMIN" in config:
-        return _as_bool(config.get("RESTRICT_SETTINGS_TO_ADMIN"))
-
-    if "PROXY_AUTH_RESTRICT_SETTINGS_TO_ADMIN" in config:
-        return _as_bool(config.get("PROXY_AUTH_RESTRICT_SETTINGS_TO_ADMIN"))
-
-    if "CWA_RESTRICT_SETTINGS_TO_ADMIN" in config:
-        return _as_bool(config.get("CWA_RESTRICT_SETTINGS_TO_ADMIN"))
+    for key in candidates:
+        if key in config:
+            return _as_bool(config[key])
 
     return None
 
@@ -135,8 +139,11 @@ def migrate_security_settings(
         if migrated_security:
             ensure_config_dir()
             config_path = Path(get_config_path())
-            with config_path.open("w") as f:
-                json.dump(config, f, indent=2)
+            # Write to a sibling temp file and swap it in, so an interrupted
+            # migration never leaves a truncated security config behind.
+            temp_path = config_path.with_suffix(config_path.suffix + ".tmp")
+            temp_path.write_text(json.dumps(config, indent=2))
+            temp_path.replace(config_path)
             logger.info("Security settings migration completed successfully")
         elif migrated_users:
             logger.info("Users settings migration completed successfully")
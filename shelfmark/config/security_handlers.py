@@ -4,6 +4,8 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import requests
+
 from shelfmark.config.env import DISABLE_LOCAL_AUTH
 from shelfmark.core.user_db import UserDB
 from shelfmark.core.utils import normalize_http_url
@@ -18,15 +20,23 @@ _OIDC_REQUIRED_FIELDS = (
     ("OIDC_CLIENT_ID", "Client ID"),
     ("OIDC_CLIENT_SECRET", "Client Secret"),
 )
+# Schema setup runs once per users.db path rather than on every settings save.
+_user_dbs: dict[str, UserDB] = {}
+
+
+def _get_user_db() -> UserDB:
+    """Return the users DB for the current config dir, initializing it only once."""
+    db_path = str(Path(os.environ.get("CONFIG_DIR", "/config")) / "users.db")
+    user_db = _user_dbs.get(db_path)
+    if user_db is None:
+        user_db = UserDB(db_path)
+        user_db.initialize()
+        _user_dbs[db_path] = user_db
+    return user_db
 
 
 def _has_local_password_admin() -> bool:
-    root = os.environ.get("CONFIG_DIR", "/config")
-    user_db = UserDB(str(Path(root) / "users.db"))
-    user_db.initialize()
-    return any(
-        user.get("password_hash") and user.get("role") == "admin" for user in user_db.list_users()
-    )
+    return _get_user_db().has_admin_with_password()
 
 
 def _load_effective_security_values(values: dict[str, Any]) -> dict[str, Any]:
@@ -101,8 +111,6 @@ def check_oidc_connection(
     logger: Any,
 ) -> dict[str, Any]:
     """Fetch and validate the configured OIDC discovery document."""
-    import requests
-
     try:
         # Prefer the current (unsaved) form value over the saved config
         discovery_url = (current_values or {}).get(
@@ -111,25 +119,29 @@ def check_oidc_connection(
         if not discovery_url:
             return {"success": False, "message": "Discovery URL is not configured."}
 
-        response = requests.get(discovery_url, timeout=10, verify=get_ssl_verify(discovery_url))
-        response.raise_for_status()
-        document = response.json()
-
-        required_fields = ["issuer", "authorization_endpoint", "token_endpoint", "jwks_uri"]
-        missing_fields = [field for field in required_fields if field not in document]
-        if missing_fields:
-            return {
-                "success": False,
-                "message": f"Discovery document missing fields: {', '.join(missing_fields)}",
-            }
-
-        # Logins verify the ID token against the provider's JWKS, so an empty key
-        # set (e.g. an Authentik provider with no Signing Key selected) means every
-        # login will fail even though discovery looks healthy.
-        jwks_uri = str(document["jwks_uri"])
-        jwks_response = requests.get(jwks_uri, timeout=10, verify=get_ssl_verify(jwks_uri))
-        jwks_response.raise_for_status()
-        jwks_document = jwks_response.json()
+        # One session so the JWKS fetch reuses the discovery request's connection
+        # when both live on the same provider host.
+        with requests.Session() as session:
+            session.headers["Accept"] = "application/json"
+            response = session.get(discovery_url, timeout=10, verify=get_ssl_verify(discovery_url))
+            response.raise_for_status()
+            document = response.json()
+
+            required_fields = ["issuer", "authorization_endpoint", "token_endpoint", "jwks_uri"]
+            missing_fields = [field for field in required_fields if field not in document]
+            if missing_fields:
+                return {
+                    "success": False,
+                    "message": f"Discovery document missing fields: {', '.join(missing_fields)}",
+                }
+
+            # Logins verify the ID token against the provider's JWKS, so an empty key
+            # set (e.g. an Authentik provider with no Signing Key selected) means every
+            # login will fail even though discovery looks healthy.
+            jwks_uri = str(document["jwks_uri"])
+            jwks_response = session.get(jwks_uri, timeout=10, verify=get_ssl_verify(jwks_uri))
+            jwks_response.raise_for_status()
+            jwks_document = jwks_response.json()
         jwks_keys = jwks_document.get("keys") if isinstance(jwks_document, dict) else None
         if not jwks_keys:
             return {
@@ -1,20 +1,18 @@
 """Core settings registration and derived configuration values."""
 
 import json
+import logging
+from collections import ChainMap
+from email.utils import parseaddr
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from shelfmark.config import env
-from shelfmark.config.booklore_settings import (
-    check_booklore_connection,
-    get_booklore_library_options,
-    get_booklore_path_options,
-)
 from shelfmark.config.download_settings_handlers import (
     check_audiobook_destination,
     check_books_destination,
 )
-from shelfmark.config.email_settings import check_email_connection
 from shelfmark.core.logger import setup_logger
 from shelfmark.core.settings_registry import (
     ActionButton,
@@ -36,16 +34,15 @@ from shelfmark.core.settings_registry import (
     register_settings,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 _DOWNLOAD_CLIENT_COMPLETED_PATH_TIMEOUT_DEFAULT = 60
 _DOWNLOAD_CLIENT_COMPLETED_PATH_TIMEOUT_MAX = 3600
 
 
 def _on_save_advanced(values: dict[str, Any]) -> dict[str, Any]:
     """Validate advanced settings before persisting."""
-    from shelfmark.core.logger import setup_logger
-
-    logger = setup_logger(__name__)
-
     timeout_key = "DOWNLOAD_CLIENT_COMPLETED_PATH_TIMEOUT"
     if timeout_key in values:
         raw_timeout = values.get(timeout_key)
@@ -123,7 +120,7 @@ def _on_save_advanced(values: dict[str, Any]) -> dict[str, Any]:
         cleaned.append({"host": host, "remotePath": remote_path, "localPath": local_path})
 
     logger.info("Saved %d remote path mapping(s)", len(cleaned))
-    if cleaned:
+    if cleaned and logger.isEnabledFor(logging.DEBUG):
         for m in cleaned:
             logger.debug(
                 "  Mapping: %s -> %s (client: %s)", m["remotePath"], m["localPath"], m["host"]
@@ -136,18 +133,46 @@ def _on_save_advanced(values: dict[str, Any]) -> dict[str, Any]:
 logger = setup_logger(__name__)
 _SMTP_PORT_MAX = 65535
 _EMAIL_ATTACHMENT_LIMIT_MB_MAX = 600
+_SMTP_SECURITY_VALUES = frozenset(("none", "starttls", "ssl"))
+
+# Keys each _on_save_downloads check reads; a partial save that touches none of
+# them cannot change that check's outcome, so the check is skipped.
+_BOOK_TEMPLATE_KEYS = frozenset(("BOOKS_OUTPUT_MODE", "FILE_ORGANIZATION", "TEMPLATE_RENAME"))
+_AUDIOBOOK_TEMPLATE_KEYS = frozenset(("FILE_ORGANIZATION_AUDIOBOOK", "TEMPLATE_AUDIOBOOK_RENAME"))
+_EMAIL_KEYS = frozenset(
+    (
+        "BOOKS_OUTPUT_MODE",
+        "EMAIL_RECIPIENT",
+        "EMAIL_SMTP_HOST",
+        "EMAIL_SMTP_SECURITY",
+        "EMAIL_SMTP_PORT",
+        "EMAIL_SMTP_TIMEOUT_SECONDS",
+        "EMAIL_SMTP_USERNAME",
+        "EMAIL_SMTP_PASSWORD",
+        "EMAIL_ATTACHMENT_SIZE_LIMIT_MB",
+        "EMAIL_FROM",
+    )
+)
 
 # Log bootstrap configuration values at DEBUG level
-logger.debug("Bootstrap configuration:")
-for key in ["CONFIG_DIR", "LOG_DIR", "TMP_DIR", "INGEST_DIR", "DEBUG", "DOCKERMODE"]:
-    if hasattr(env, key):
-        logger.debug("  %s: %s", key, getattr(env, key))
+_BOOTSTRAP_LOG_KEYS = ("CONFIG_DIR", "LOG_DIR", "TMP_DIR", "INGEST_DIR", "DEBUG", "DOCKERMODE")
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug(
+        "Bootstrap configuration: %s",
+        {key: getattr(env, key) for key in _BOOTSTRAP_LOG_KEYS if hasattr(env, key)},
+    )
 
-# Load supported book languages from data file
+# Supported book languages come from a bundled data file.
 # Path is relative to the package root, not this file
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
-with (_DATA_DIR / "book-languages.json").open() as file:
-    _SUPPORTED_BOOK_LANGUAGE = json.load(file)
+
+
+@lru_cache(maxsize=1)
+def _get_supported_book_languages() -> list[dict[str, Any]]:
+    """Load the bundled book language list on first use."""
+    with (_DATA_DIR / "book-languages.json").open() as file:
+        return json.load(file)
+
 
 # Directory settings
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -243,14 +268,41 @@ _DOWNLOAD_TO_BROWSER_CONTENT_TYPE_VALUES = {
 }
 
 
+def _get_booklore_library_options() -> list[dict[str, Any]]:
+    """Build Booklore library options, importing the Booklore client on first use."""
+    from shelfmark.config.booklore_settings import get_booklore_library_options
+
+    return get_booklore_library_options()
+
+
+def _get_booklore_path_options() -> list[dict[str, Any]]:
+    """Build Booklore path options, importing the Booklore client on first use."""
+    from shelfmark.config.booklore_settings import get_booklore_path_options
+
+    return get_booklore_path_options()
+
+
+def _check_booklore_connection(current_values: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Test the Booklore connection; the client is only imported when the button is used."""
+    from shelfmark.config.booklore_settings import check_booklore_connection
+
+    return check_booklore_connection(current_values)
+
+
+def _check_email_connection(current_values: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Test SMTP connectivity; the email output is only imported when the button is used."""
+    from shelfmark.config.email_settings import check_email_connection
+
+    return check_email_connection(current_values)
+
+
 def _get_metadata_provider_options() -> list[dict[str, str]]:
     """Build metadata provider options dynamically from enabled providers only."""
-    from shelfmark.metadata_providers import is_provider_enabled, list_providers
+    from shelfmark.metadata_providers import list_enabled_providers
 
     options = [
         {"value": provider["name"], "label": provider["display_name"]}
-        for provider in list_providers()
-        if is_provider_enabled(provider["name"])
+        for provider in list_enabled_providers()
     ]
 
     # If no providers enabled, show a placeholder option
@@ -296,9 +348,13 @@ def _get_audiobook_release_source_options() -> list[dict[str, str]]:
     ]
 
 
-_LANGUAGE_OPTIONS = [
-    {"value": lang["code"], "label": lang["language"]} for lang in _SUPPORTED_BOOK_LANGUAGE
-]
+@lru_cache(maxsize=1)
+def _get_language_options() -> list[dict[str, str]]:
+    """Build book language options from the bundled language list."""
+    return [
+        {"value": lang["code"], "label": lang["language"]}
+        for lang in _get_supported_book_languages()
+    ]
 
 
 def _string_setting(value: object) -> str:
@@ -325,7 +381,7 @@ def _get_aa_base_url_options() -> list[dict[str, str]]:
         all_mirrors = [configured_url, *all_mirrors]
 
     for url in all_mirrors:
-        domain = url.replace("https://", "").replace("http://", "")
+        domain = url.removeprefix("https://").removeprefix("http://")
         label = domain
         if configured_url and url == configured_url:
             label = f"{domain} (configured)"
@@ -425,7 +481,7 @@ def general_settings() -> list[SettingsField]:
             key="BOOK_LANGUAGE",
             label="Default Book Languages",
             description="Default language filter for searches.",
-            options=_LANGUAGE_OPTIONS,
+            options=_get_language_options,
             default=["en"],
         ),
     ]
@@ -706,187 +762,214 @@ def _contains_path_separators(value: Any) -> bool:
     return isinstance(value, str) and ("/" in value or "\\" in value)
 
 
-def _on_save_downloads(values: dict[str, Any]) -> dict[str, Any]:
-    """Validate download settings before persisting."""
-    existing = load_config_file("downloads")
-    effective: dict[str, Any] = dict(existing)
-    effective.update(values)
+def _is_plain_email_address(addr: str) -> bool:
+    parsed = parseaddr(addr or "")[1]
+    return bool(parsed) and "@" in parsed and parsed == addr
 
-    if "DOWNLOAD_TO_BROWSER_CONTENT_TYPES" in effective:
-        raw_content_types = effective.get("DOWNLOAD_TO_BROWSER_CONTENT_TYPES")
-        if raw_content_types is None:
-            normalized_content_types: list[str] = []
-        elif isinstance(raw_content_types, list):
-            normalized_content_types = [
-                str(value).strip().lower() for value in raw_content_types if str(value).strip()
-            ]
-        else:
-            return {
-                "error": True,
-                "message": "Download to Browser must be a list.",
-                "values": values,
-            }
 
-        deduped_content_types: list[str] = []
-        for content_type in normalized_content_types:
-            if content_type not in _DOWNLOAD_TO_BROWSER_CONTENT_TYPE_VALUES:
-                allowed = ", ".join(sorted(_DOWNLOAD_TO_BROWSER_CONTENT_TYPE_VALUES))
-                return {
-                    "error": True,
-                    "message": (
-                        "Download to Browser contains an unsupported content type "
-                        f"'{content_type}'. Supported values: {allowed}"
-                    ),
-                    "values": values,
-                }
-            if content_type not in deduped_content_types:
-                deduped_content_types.append(content_type)
+def _parse_bounded_int(
+    effective: Mapping[str, Any],
+    key: str,
+    default: int,
+    label: str,
+    maximum: int | None = None,
+) -> int:
+    """Coerce an integer setting, raising ValueError with a user-facing message if invalid."""
+    try:
+        value = int(effective.get(key, default))
+    except TypeError, ValueError:
+        msg = f"{label} must be a number"
+        raise ValueError(msg) from None
+
+    if maximum is None:
+        if value < 1:
+            msg = f"{label} must be >= 1"
+            raise ValueError(msg)
+    elif value < 1 or value > maximum:
+        msg = f"{label} must be between 1 and {maximum}"
+        raise ValueError(msg)
+    return value
+
+
+def _validate_books_template(
+    effective: Mapping[str, Any], values: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Reject path separators in the books rename template (folder output only)."""
+    if values.keys().isdisjoint(_BOOK_TEMPLATE_KEYS):
+        return None
+    if effective.get("BOOKS_OUTPUT_MODE", "folder") != "folder":
+        return None
+    if effective.get("FILE_ORGANIZATION", "rename") != "rename":
+        return None
 
-        values["DOWNLOAD_TO_BROWSER_CONTENT_TYPES"] = deduped_content_types
-        effective["DOWNLOAD_TO_BROWSER_CONTENT_TYPES"] = deduped_content_types
+    if _contains_path_separators(effective.get("TEMPLATE_RENAME", "")):
+        return {
+            "error": True,
+            "message": "Books Naming Template cannot contain '/' or '\\' in Rename mode. Use Organize mode to create folders.",
+            "values": values,
+        }
+    return None
 
-    # Books: only validate templates when saving to a folder.
-    books_output_mode = effective.get("BOOKS_OUTPUT_MODE", "folder")
-    if books_output_mode == "folder" and effective.get("FILE_ORGANIZATION", "rename") == "rename":
-        template = effective.get("TEMPLATE_RENAME", "")
-        if _contains_path_separators(template):
-            return {
-                "error": True,
-                "message": "Books Naming Template cannot contain '/' or '\\' in Rename mode. Use Organize mode to create folders.",
-                "values": values,
-            }
 
-    # Audiobooks are always folder output.
-    if effective.get("FILE_ORGANIZATION_AUDIOBOOK", "rename") == "rename":
-        template = effective.get("TEMPLATE_AUDIOBOOK_RENAME", "")
-        if _contains_path_separators(template):
-            return {
-                "error": True,
-                "message": "Audiobooks Naming Template cannot contain '/' or '\\' in Rename mode. Use Organize mode to create folders.",
-                "values": values,
-            }
+def _validate_audiobook_template(
+    effective: Mapping[str, Any], values: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Reject path separators in the audiobook rename template (always folder output)."""
+    if values.keys().isdisjoint(_AUDIOBOOK_TEMPLATE_KEYS):
+        return None
+    if effective.get("FILE_ORGANIZATION_AUDIOBOOK", "rename") != "rename":
+        return None
+
+    if _contains_path_separators(effective.get("TEMPLATE_AUDIOBOOK_RENAME", "")):
+        return {
+            "error": True,
+            "message": "Audiobooks Naming Template cannot contain '/' or '\\' in Rename mode. Use Organize mode to create folders.",
+            "values": values,
+        }
+    return None
+
 
-    # Email output (SMTP) validation.
-    if books_output_mode == "email":
-        from email.utils import parseaddr
+def _validate_email_mode(
+    effective: Mapping[str, Any], values: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Validate and normalize SMTP settings when books are sent by email."""
+    if values.keys().isdisjoint(_EMAIL_KEYS):
+        return None
+    if effective.get("BOOKS_OUTPUT_MODE", "folder") != "email":
+        return None
 
-        def _is_plain_email_address(addr: str) -> bool:
-            parsed = parseaddr(addr or "")[1]
-            return bool(parsed) and "@" in parsed and parsed == addr
+    # Preferred model: single recipient for global default and per-user override.
+    raw_recipient = str(effective.get("EMAIL_RECIPIENT", "") or "").strip()
 
-        # Preferred model: single recipient for global default and per-user override.
-        raw_recipient = str(effective.get("EMAIL_RECIPIENT", "") or "").strip()
+    # Optional global fallback: validate only when a default recipient is provided.
+    if raw_recipient and not _is_plain_email_address(raw_recipient):
+        return {
+            "error": True,
+            "message": "Email recipient must be a valid plain email address.",
+            "values": values,
+        }
 
-        # Optional global fallback: validate only when a default recipient is provided.
-        if raw_recipient and not _is_plain_email_address(raw_recipient):
-            return {
-                "error": True,
-                "message": "Email recipient must be a valid plain email address.",
-                "values": values,
-            }
+    smtp_host = str(effective.get("EMAIL_SMTP_HOST", "") or "").strip()
+    if not smtp_host:
+        return {"error": True, "message": "SMTP host is required", "values": values}
 
-        smtp_host = str(effective.get("EMAIL_SMTP_HOST", "") or "").strip()
-        if not smtp_host:
-            return {"error": True, "message": "SMTP host is required", "values": values}
+    security = str(effective.get("EMAIL_SMTP_SECURITY", "starttls") or "").strip().lower()
+    if security not in _SMTP_SECURITY_VALUES:
+        return {
+            "error": True,
+            "message": "SMTP security must be one of: none, starttls, ssl",
+            "values": values,
+        }
 
-        security = str(effective.get("EMAIL_SMTP_SECURITY", "starttls") or "").strip().lower()
-        if security not in {"none", "starttls", "ssl"}:
-            return {
-                "error": True,
-                "message": "SMTP security must be one of: none, starttls, ssl",
-                "values": values,
-            }
+    try:
+        port = _parse_bounded_int(effective, "EMAIL_SMTP_PORT", 587, "SMTP port", _SMTP_PORT_MAX)
+        timeout_seconds = _parse_bounded_int(
+            effective, "EMAIL_SMTP_TIMEOUT_SECONDS", 60, "SMTP timeout (seconds)"
+        )
+    except ValueError as e:
+        return {"error": True, "message": str(e), "values": values}
 
-        try:
-            port = int(effective.get("EMAIL_SMTP_PORT", 587))
-        except TypeError, ValueError:
-            return {"error": True, "message": "SMTP port must be a number", "values": values}
+    username = str(effective.get("EMAIL_SMTP_USERNAME", "") or "").strip()
+    password = effective.get("EMAIL_SMTP_PASSWORD", "") or ""
+    if username and not password:
+        return {
+            "error": True,
+            "message": "SMTP password is required when username is set",
+            "values": values,
+        }
 
-        if port < 1 or port > _SMTP_PORT_MAX:
+    try:
+        attachment_limit_mb = _parse_bounded_int(
+            effective,
+            "EMAIL_ATTACHMENT_SIZE_LIMIT_MB",
+            25,
+            "Attachment size limit (MB)",
+            _EMAIL_ATTACHMENT_LIMIT_MB_MAX,
+        )
+    except ValueError as e:
+        return {"error": True, "message": str(e), "values": values}
+
+    from_addr = str(effective.get("EMAIL_FROM", "") or "").strip()
+    if not from_addr:
+        # If From is empty, default to the SMTP username when it looks like an email address.
+        username_email = parseaddr(username)[1]
+        if username_email and "@" in username_email:
+            from_addr = f"Shelfmark <{username_email}>"
+            values["EMAIL_FROM"] = from_addr
+        else:
             return {
                 "error": True,
-                "message": f"SMTP port must be between 1 and {_SMTP_PORT_MAX}",
+                "message": "From address is required (or set SMTP username to an email address).",
                 "values": values,
             }
-
-        try:
-            timeout_seconds = int(effective.get("EMAIL_SMTP_TIMEOUT_SECONDS", 60))
-        except TypeError, ValueError:
+    else:
+        from_email = parseaddr(from_addr)[1]
+        if not from_email or "@" not in from_email:
             return {
                 "error": True,
-                "message": "SMTP timeout (seconds) must be a number",
+                "message": "From address must be a valid email address",
                 "values": values,
             }
 
-        if timeout_seconds < 1:
-            return {
-                "error": True,
-                "message": "SMTP timeout (seconds) must be >= 1",
-                "values": values,
-            }
+    # Persist any normalization/coercion for fields that may have been edited this save.
+    if "EMAIL_RECIPIENT" in values:
+        values["EMAIL_RECIPIENT"] = raw_recipient
+    if "EMAIL_SMTP_SECURITY" in values:
+        values["EMAIL_SMTP_SECURITY"] = security
+    if "EMAIL_SMTP_PORT" in values:
+        values["EMAIL_SMTP_PORT"] = port
+    if "EMAIL_SMTP_TIMEOUT_SECONDS" in values:
+        values["EMAIL_SMTP_TIMEOUT_SECONDS"] = timeout_seconds
+    if "EMAIL_ATTACHMENT_SIZE_LIMIT_MB" in values:
+        values["EMAIL_ATTACHMENT_SIZE_LIMIT_MB"] = attachment_limit_mb
+    return None
 
-        username = str(effective.get("EMAIL_SMTP_USERNAME", "") or "").strip()
-        password = effective.get("EMAIL_SMTP_PASSWORD", "") or ""
-        if username and not password:
-            return {
-                "error": True,
-                "message": "SMTP password is required when username is set",
-                "values": values,
-            }
 
-        try:
-            attachment_limit_mb = int(effective.get("EMAIL_ATTACHMENT_SIZE_LIMIT_MB", 25))
-        except TypeError, ValueError:
-            return {
-                "error": True,
-                "message": "Attachment size limit (MB) must be a number",
-                "values": values,
-            }
+def _on_save_downloads(values: dict[str, Any]) -> dict[str, Any]:
+    """Validate download settings before persisting."""
+    # Saved values shadow persisted ones; writes land in ``values``.
+    effective: ChainMap[str, Any] = ChainMap(values, load_config_file("downloads"))
 
-        if attachment_limit_mb < 1 or attachment_limit_mb > _EMAIL_ATTACHMENT_LIMIT_MB_MAX:
+    if "DOWNLOAD_TO_BROWSER_CONTENT_TYPES" in effective:
+        raw_content_types = effective.get("DOWNLOAD_TO_BROWSER_CONTENT_TYPES")
+        if raw_content_types is None:
+            normalized_content_types: list[str] = []
+        elif isinstance(raw_content_types, list):
+            normalized_content_types = [
+                str(value).strip().lower() for value in raw_content_types if str(value).strip()
+            ]
+        else:
             return {
                 "error": True,
-                "message": (
-                    "Attachment size limit (MB) must be between 1 and "
-                    f"{_EMAIL_ATTACHMENT_LIMIT_MB_MAX}"
-                ),
+                "message": "Download to Browser must be a list.",
                 "values": values,
             }
 
-        from_addr = str(effective.get("EMAIL_FROM", "") or "").strip()
-        if not from_addr:
-            # If From is empty, default to the SMTP username when it looks like an email address.
-            username_email = parseaddr(username)[1]
-            if username_email and "@" in username_email:
-                from_addr = f"Shelfmark <{username_email}>"
-                values["EMAIL_FROM"] = from_addr
-            else:
-                return {
-                    "error": True,
-                    "message": "From address is required (or set SMTP username to an email address).",
-                    "values": values,
-                }
-        else:
-            from_email = parseaddr(from_addr)[1]
-            if not from_email or "@" not in from_email:
+        deduped_content_types: list[str] = []
+        for content_type in normalized_content_types:
+            if content_type not in _DOWNLOAD_TO_BROWSER_CONTENT_TYPE_VALUES:
+                allowed = ", ".join(sorted(_DOWNLOAD_TO_BROWSER_CONTENT_TYPE_VALUES))
                 return {
                     "error": True,
-                    "message": "From address must be a valid email address",
+                    "message": (
+                        "Download to Browser contains an unsupported content type "
+                        f"'{content_type}'. Supported values: {allowed}"
+                    ),
                     "values": values,
                 }
+            if content_type not in deduped_content_types:
+                deduped_content_types.append(content_type)
 
-        # Persist any normalization/coercion for fields that may have been edited this save.
-        if "EMAIL_RECIPIENT" in values:
-            values["EMAIL_RECIPIENT"] = raw_recipient
-        if "EMAIL_SMTP_SECURITY" in values:
-            values["EMAIL_SMTP_SECURITY"] = security
-        if "EMAIL_SMTP_PORT" in values:
-            values["EMAIL_SMTP_PORT"] = port
-        if "EMAIL_SMTP_TIMEOUT_SECONDS" in values:
-            values["EMAIL_SMTP_TIMEOUT_SECONDS"] = timeout_seconds
-        if "EMAIL_ATTACHMENT_SIZE_LIMIT_MB" in values:
-            values["EMAIL_ATTACHMENT_SIZE_LIMIT_MB"] = attachment_limit_mb
+        values["DOWNLOAD_TO_BROWSER_CONTENT_TYPES"] = deduped_content_types
 
+    for validator in (
+        _validate_books_template,
+        _validate_audiobook_template,
+        _validate_email_mode,
+    ):
+        error = validator(effective, values)
+        if error is not None:
+            return error
     return {"error": False, "values": values}
 
 
@@ -1105,7 +1188,7 @@ def download_settings() -> list[SettingsField]:
             key="BOOKLORE_LIBRARY_ID",
             label="Library",
             description="Grimmory library to upload into.",
-            options=get_booklore_library_options,
+            options=_get_booklore_library_options,
             required=True,
             user_overridable=True,
             show_when=[
@@ -1117,7 +1200,7 @@ def download_settings() -> list[SettingsField]:
             key="BOOKLORE_PATH_ID",
             label="Path",
             description="Grimmory library path for uploads.",
-            options=get_booklore_path_options,
+            options=_get_booklore_path_options,
             required=True,
             filter_by_field="BOOKLORE_LIBRARY_ID",
             user_overridable=True,
@@ -1131,7 +1214,7 @@ def download_settings() -> list[SettingsField]:
             label="Test Connection",
             description="Verify your Grimmory configuration",
             style="primary",
-            callback=check_booklore_connection,
+            callback=_check_booklore_connection,
             show_when={"field": "BOOKS_OUTPUT_MODE", "value": "booklore"},
         ),
         HeadingField(
@@ -1239,7 +1322,7 @@ def download_settings() -> list[SettingsField]:
             label="Test SMTP Connection",
             description="Verify your SMTP configuration (connect + optional login).",
             style="primary",
-            callback=check_email_connection,
+            callback=_check_email_connection,
             show_when={"field": "BOOKS_OUTPUT_MODE", "value": "email"},
         ),
         # === AUDIOBOOKS SECTION ===
@@ -1426,46 +1509,49 @@ def _get_slow_source_options() -> list[dict[str, str | bool | None]]:
             return "Requires Cloudflare bypass"
         return None
 
+    reasons = {
+        source_id: _get_reason(source_id)
+        for source_id in ("aa-slow-nowait", "aa-slow-wait", "welib", "zlib")
+    }
+
     return [
         {
             "id": "aa-slow-nowait",
             "label": "AA Slow Downloads (No Waitlist)",
             "description": "Partner servers",
-            "isLocked": _get_reason("aa-slow-nowait") is not None,
-            "disabledReason": _get_reason("aa-slow-nowait"),
+            "isLocked": reasons["aa-slow-nowait"] is not None,
+            "disabledReason": reasons["aa-slow-nowait"],
         },
         {
             "id": "aa-slow-wait",
             "label": "AA Slow Downloads (Waitlist)",
             "description": "Partner servers with countdown timer",
-            "isLocked": _get_reason("aa-slow-wait") is not None,
-            "disabledReason": _get_reason("aa-slow-wait"),
+            "isLocked": reasons["aa-slow-wait"] is not None,
+            "disabledReason": reasons["aa-slow-wait"],
         },
         {
             "id": "welib",
             "label": "Welib",
             "description": "Alternative mirror",
-            "isLocked": _get_reason("welib") is not None,
-            "disabledReason": _get_reason("welib"),
+            "isLocked": reasons["welib"] is not None,
+            "disabledReason": reasons["welib"],
         },
         {
             "id": "zlib",
             "label": "Zlib",
             "description": "Alternative mirror",
-            "isLocked": _get_reason("zlib") is not None,
-            "disabledReason": _get_reason("zlib"),
+            "isLocked": reasons["zlib"] is not None,
+            "disabledReason": reasons["zlib"],
         },
     ]
 
 
 def _get_slow_source_defaults() -> list[dict[str, str | bool]]:
     """Default source priority order for slow sources."""
-    from shelfmark.config.env import _LEGACY_ALLOW_USE_WELIB
-
     return [
         {"id": "aa-slow-nowait", "enabled": True},
         {"id": "aa-slow-wait", "enabled": True},
-        {"id": "welib", "enabled": _LEGACY_ALLOW_USE_WELIB},
+        {"id": "welib", "enabled": env._LEGACY_ALLOW_USE_WELIB},
         {"id": "zlib", "enabled": True},
     ]
 
@@ -1666,21 +1752,24 @@ def _on_save_mirrors(values: dict[str, Any]) -> dict[str, Any]:
             continue
 
         if isinstance(raw_urls, str):
-            parts = [p.strip() for p in raw_urls.split(",") if p.strip()]
+            parts = [p for p in (part.strip() for part in raw_urls.split(",")) if p]
         elif isinstance(raw_urls, list):
-            parts = [str(p).strip() for p in raw_urls if str(p).strip()]
+            parts = [p for p in (str(part).strip() for part in raw_urls) if p]
         else:
             parts = []
 
-        normalized: list[str] = []
-        for url in parts:
-            if url.lower() == "auto":
-                continue
-            norm = normalize_http_url(url, default_scheme="https")
-            if norm and norm not in normalized:
-                normalized.append(norm)
+        # dict.fromkeys keeps first-seen order while dropping duplicates.
+        normalized = dict.fromkeys(
+            norm
+            for norm in (
+                normalize_http_url(url, default_scheme="https")
+                for url in parts
+                if url.lower() != "auto"
+            )
+            if norm
+        )
 
-        values[key] = normalized
+        values[key] = list(normalized)
 
     return {"error": False, "values": values}
 
@@ -257,7 +257,7 @@ def get_zlib_cookie_domains() -> set:
     domains = set()
 
     for url in get_zlib_mirrors():
-        domain = url.replace("https://", "").replace("http://", "").split("/")[0]
+        domain = url.removeprefix("https://").removeprefix("http://").split("/")[0]
         domains.add(domain)
 
     return domains
@@ -1,6 +1,8 @@
 """Template-based naming for library organization."""
 
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -33,6 +35,15 @@ BRACE_PATTERN = re.compile(r"\{([^}]+)\}")
 # Characters that are invalid in filenames on various filesystems
 INVALID_CHARS = re.compile(r'[\\/:*?"<>|]')
 
+# Literal-block detection and post-render cleanup patterns
+_WHITESPACE_PATTERN = re.compile(r"\s")
+_REPEATED_SLASH_PATTERN = re.compile(r"/+")
+_LEADING_SEPARATORS_PATTERN = re.compile(r"^[\s\-_.]+")
+_TRAILING_SEPARATORS_PATTERN = re.compile(r"[\s\-_.]+$")
+_REPEATED_DASH_PATTERN = re.compile(r"(\s*-\s*){2,}")
+_EMPTY_PARENS_PATTERN = re.compile(r"\(\s*\)")
+_EMPTY_BRACKETS_PATTERN = re.compile(r"\[\s*\]")
+
 
 def _sanitize(name: str | None, max_length: int = 245) -> str:
     """Sanitize a string for filesystem use."""
@@ -109,6 +120,66 @@ def assign_part_numbers(
     ]
 
 
+def _find_placeholder(content: str) -> tuple[str | None, int]:
+    content_lower = content.lower()
+    for placeholder_name in KNOWN_TOKENS:
+        idx = content_lower.find(placeholder_name)
+        if idx != -1:
+            return placeholder_name, idx
+    return None, -1
+
+
+@dataclass(frozen=True)
+class _TemplateBlock:
+    """One ``{...}`` block of a naming template, resolved against KNOWN_TOKENS."""
+
+    raw: str
+    content: str
+    placeholder: str | None
+    prefix: str = ""
+    suffix: str = ""
+    # Placeholder of an immediately following block; makes this block a conditional literal.
+    next_placeholder: str | None = None
+
+
+@lru_cache(maxsize=64)
+def _compile_naming_template(template: str) -> tuple[str | _TemplateBlock, ...]:
+    """Split a template into literal text and brace blocks once per distinct template."""
+    matches = list(BRACE_PATTERN.finditer(template))
+    segments: list[str | _TemplateBlock] = []
+    cursor = 0
+    for idx, match in enumerate(matches):
+        if match.start() > cursor:
+            segments.append(template[cursor : match.start()])
+        content = match.group(1)
+        placeholder_name, placeholder_idx = _find_placeholder(content)
+
+        if placeholder_name is not None:
+            block = _TemplateBlock(
+                raw=match.group(0),
+                content=content,
+                placeholder=placeholder_name,
+                prefix=content[:placeholder_idx],
+                suffix=content[placeholder_idx + len(placeholder_name) :],
+            )
+        else:
+            next_placeholder_name = None
+            if idx + 1 < len(matches) and match.end() == matches[idx + 1].start():
+                next_placeholder_name, _next_idx = _find_placeholder(matches[idx + 1].group(1))
+            block = _TemplateBlock(
+                raw=match.group(0),
+                content=content,
+                placeholder=None,
+                next_placeholder=next_placeholder_name,
+            )
+        segments.append(block)
+        cursor = match.end()
+
+    if cursor < len(template):
+        segments.append(template[cursor:])
+    return tuple(segments)
+
+
 def parse_naming_template(
     template: str,
     metadata: Mapping[str, str | int | float | None],
@@ -122,14 +193,6 @@ def parse_naming_template(
     # Normalize metadata keys to lowercase for case-insensitive matching
     normalized = {k.lower(): v for k, v in metadata.items()}
 
-    def find_placeholder(content: str) -> tuple[str | None, int]:
-        content_lower = content.lower()
-        for placeholder_name in KNOWN_TOKENS:
-            idx = content_lower.find(placeholder_name)
-            if idx != -1:
-                return placeholder_name, idx
-        return None, -1
-
     def placeholder_value(placeholder_name: str) -> str:
         value = normalized.get(placeholder_name)
         if placeholder_name == "seriesposition":
@@ -138,75 +201,45 @@ def parse_naming_template(
             return ""
         return str(value).strip()
 
-    def render_block(content: str) -> str | None:
-        placeholder_name, idx = find_placeholder(content)
-        if placeholder_name is None:
-            return None
-
-        prefix = content[:idx]
-        suffix = content[idx + len(placeholder_name) :]
-        value = placeholder_value(placeholder_name)
-        if not value:
-            return ""
-
-        if not allow_path_separators:
-            value = value.replace("/", "_")
-        value = sanitize_filename(value)
-        return f"{prefix}{value}{suffix}"
-
     # Process brace blocks in order so we can support conditional literal blocks like:
     # { - Part }{PartNumber}
-    matches = list(BRACE_PATTERN.finditer(template))
-    if not matches:
-        result = template
-    else:
-        parts: list[str] = []
-        cursor = 0
-        for idx, match in enumerate(matches):
-            parts.append(template[cursor : match.start()])
-            content = match.group(1)
-            rendered = render_block(content)
-
-            if rendered is not None:
-                parts.append(rendered)
-            else:
-                conditional_literal = False
-                include_literal = False
-                if idx + 1 < len(matches) and match.end() == matches[idx + 1].start():
-                    next_content = matches[idx + 1].group(1)
-                    next_placeholder_name, _next_idx = find_placeholder(next_content)
-                    if next_placeholder_name is not None:
-                        conditional_literal = True
-                        include_literal = bool(placeholder_value(next_placeholder_name))
-                if include_literal:
-                    parts.append(content)
-                elif not conditional_literal and re.search(r"\s", content):
-                    # Preserve blocks that look like literal text, but treat bare unknown
-                    # placeholders as missing variables.
-                    parts.append(match.group(0))
-
-            cursor = match.end()
-
-        parts.append(template[cursor:])
-        result = "".join(parts)
+    parts: list[str] = []
+    for segment in _compile_naming_template(template):
+        if isinstance(segment, str):
+            parts.append(segment)
+        elif segment.placeholder is not None:
+            value = placeholder_value(segment.placeholder)
+            if value:
+                if not allow_path_separators:
+                    value = value.replace("/", "_")
+                value = sanitize_filename(value)
+                parts.append(f"{segment.prefix}{value}{segment.suffix}")
+        elif segment.next_placeholder is not None:
+            if placeholder_value(segment.next_placeholder):
+                parts.append(segment.content)
+        elif _WHITESPACE_PATTERN.search(segment.content):
+            # Preserve blocks that look like literal text, but treat bare unknown
+            # placeholders as missing variables.
+            parts.append(segment.raw)
+    result = "".join(parts)
 
     # Clean up any double slashes that might result from empty tokens
-    result = re.sub(r"/+", "/", result)
+    result = _REPEATED_SLASH_PATTERN.sub("/", result)
 
     # Remove leading/trailing slashes
     result = result.strip("/")
 
     # Clean up any orphaned separators (e.g., " - " at start/end, or " -  - ")
-    result = re.sub(r"^[\s\-_.]+", "", result)
-    result = re.sub(r"[\s\-_.]+$", "", result)
-    result = re.sub(r"(\s*-\s*){2,}", " - ", result)
+    result = _LEADING_SEPARATORS_PATTERN.sub("", result)
+    result = _TRAILING_SEPARATORS_PATTERN.sub("", result)
+    result = _REPEATED_DASH_PATTERN.sub(" - ", result)
 
     # Clean up empty parentheses/brackets
-    result = re.sub(r"\(\s*\)", "", result)
-    result = re.sub(r"\[\s*\]", "", result)
+    result = _EMPTY_PARENS_PATTERN.sub("", result)
+    result = _EMPTY_BRACKETS_PATTERN.sub("", result)
 
     # Final trim of any trailing separators left after cleanup
-    return re.sub(r"[\s\-_.]+$", "", result)
+    return _TRAILING_SEPARATORS_PATTERN.sub("", result)
 
 
 def build_library_path(
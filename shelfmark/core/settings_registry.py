@@ -2,6 +2,7 @@
 
 import json
 import os
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
@@ -21,7 +22,7 @@ if TYPE_CHECKING:
     from shelfmark.core.config import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldBase:
     """Base class for all settings fields."""
 
@@ -54,7 +55,7 @@ class FieldBase:
         return self.__class__.__name__
 
 
-@dataclass
+@dataclass(slots=True)
 class TextField(FieldBase):
     """Single-line text input."""
 
@@ -62,14 +63,14 @@ class TextField(FieldBase):
     max_length: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PasswordField(FieldBase):
     """Password input (masked in UI, not returned in API responses)."""
 
     placeholder: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberField(FieldBase):
     """Numeric input."""
 
@@ -79,14 +80,14 @@ class NumberField(FieldBase):
     default: float = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckboxField(FieldBase):
     """Boolean checkbox."""
 
     default: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectField(FieldBase):
     """Single-choice dropdown."""
 
@@ -95,7 +96,7 @@ class SelectField(FieldBase):
     filter_by_field: str | None = None  # Field key whose value filters options via childOf property
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiSelectField(FieldBase):
     """Multiple-choice selection."""
 
@@ -105,7 +106,7 @@ class MultiSelectField(FieldBase):
     variant: str = "pills"  # "pills" (default) or "dropdown" for checkbox dropdown style
 
 
-@dataclass
+@dataclass(slots=True)
 class TagListField(FieldBase):
     """Editable list of free-form string values (tag/chip input)."""
 
@@ -114,7 +115,7 @@ class TagListField(FieldBase):
     normalize_urls: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderableListField(FieldBase):
     """Settings field for ordered, toggleable option lists."""
 
@@ -127,7 +128,7 @@ class OrderableListField(FieldBase):
     default: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableField(FieldBase):
     """Editable table of structured rows."""
 
@@ -141,7 +142,7 @@ class TableField(FieldBase):
     empty_message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomComponentField:
     """Render a custom frontend component inside settings content."""
 
@@ -168,7 +169,7 @@ class CustomComponentField:
         return [f.key for f in self.value_fields if getattr(f, "key", None)]
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionButton:
     """Definition for a custom action button in the settings UI."""
 
@@ -194,7 +195,7 @@ class ActionButton:
         return "ActionButton"
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadingField:
     """Display-only heading with title and description.
 
@@ -412,6 +413,13 @@ def _get_config_file_path(tab_name: str) -> Path:
     return config_path
 
 
+# (tab name, parsed config) for the tab update_settings is saving, so one save
+# reads and parses that tab's file once.
+_SAVING_TAB_CONFIG: ContextVar[tuple[str, dict[str, Any]] | None] = ContextVar(
+    "_SAVING_TAB_CONFIG", default=None
+)
+
+
 def _ensure_config_dir(tab_name: str) -> None:
     """Ensure the config directory exists."""
     config_path = _get_config_file_path(tab_name)
@@ -420,6 +428,11 @@ def _ensure_config_dir(tab_name: str) -> None:
 
 def load_config_file(tab_name: str) -> dict[str, Any]:
     """Load a settings tab config file, returning an empty dict on failure."""
+    saving = _SAVING_TAB_CONFIG.get()
+    if saving is not None and saving[0] == tab_name:
+        # Shallow copy: callers only replace top-level keys of the loaded dict
+        return dict(saving[1])
+
     config_path = _get_config_file_path(tab_name)
 
     if not config_path.exists():
@@ -941,11 +954,23 @@ def is_value_from_env(field: FieldBase) -> bool:
     return has_env_value
 
 
+def _resolve_options(options: object, options_cache: dict[Any, object] | None) -> object:
+    """Evaluate callable options, reusing results already built in this serialization pass."""
+    if not callable(options):
+        return options
+    if options_cache is None:
+        return options()
+    if options not in options_cache:
+        options_cache[options] = options()
+    return options_cache[options]
+
+
 def serialize_field(
     field: SettingsField,
     tab_name: str,
     *,
     include_value: bool = True,
+    options_cache: dict[Any, object] | None = None,
 ) -> dict[str, Any]:
     """Serialize a field for API response.
 
@@ -953,6 +978,8 @@ def serialize_field(
         field: The settings field.
         tab_name: The settings tab name.
         include_value: Whether to include the current value.
+        options_cache: Shared across one tab/all-settings serialization so fields
+            with the same options builder only run it once.
 
     Returns:
         Dict representation of the field.
@@ -978,6 +1005,7 @@ def serialize_field(
                     value_field,
                     tab_name,
                     include_value=include_value,
+                    options_cache=options_cache,
                 )
                 serialized_bound_field["hiddenInUi"] = True
                 bound_fields.append(serialized_bound_field)
@@ -1041,24 +1069,21 @@ def serialize_field(
         result["step"] = field.step
     elif isinstance(field, SelectField):
         # Support callable options for lazy evaluation (avoids circular imports)
-        options = field.options() if callable(field.options) else field.options
-        result["options"] = options
+        result["options"] = _resolve_options(field.options, options_cache)
         if field.default is not None:
             result["default"] = field.default
         if field.filter_by_field:
             result["filterByField"] = field.filter_by_field
     elif isinstance(field, MultiSelectField):
         # Support callable options for lazy evaluation (avoids circular imports)
-        options = field.options() if callable(field.options) else field.options
-        result["options"] = options
+        result["options"] = _resolve_options(field.options, options_cache)
         result["variant"] = field.variant
     elif isinstance(field, TagListField):
         result["placeholder"] = field.placeholder
         result["normalizeUrls"] = field.normalize_urls
     elif isinstance(field, OrderableListField):
         # Support callable options for lazy evaluation (avoids circular imports)
-        options = field.options() if callable(field.options) else field.options
-        result["options"] = options
+        result["options"] = _resolve_options(field.options, options_cache)
     elif isinstance(field, TableField):
         columns = field.columns() if callable(field.columns) else field.columns
         result["columns"] = columns
@@ -1109,15 +1134,21 @@ def serialize_tab(
     tab: SettingsTab,
     *,
     include_values: bool = True,
+    options_cache: dict[Any, object] | None = None,
 ) -> dict[str, Any]:
     """Serialize a settings tab for API response."""
+    if options_cache is None:
+        options_cache = {}
     return {
         "name": tab.name,
         "displayName": tab.display_name,
         "icon": tab.icon,
         "order": tab.order,
         "group": tab.group,
-        "fields": [serialize_field(f, tab.name, include_value=include_values) for f in tab.fields],
+        "fields": [
+            serialize_field(f, tab.name, include_value=include_values, options_cache=options_cache)
+            for f in tab.fields
+        ],
     }
 
 
@@ -1140,8 +1171,12 @@ def serialize_all_settings(*, include_values: bool = True) -> dict[str, Any]:
     """Serialize all settings for API response."""
     tabs = get_all_settings_tabs()
     groups = get_all_groups()
+    options_cache: dict[Any, object] = {}
     return {
-        "tabs": [serialize_tab(t, include_values=include_values) for t in tabs],
+        "tabs": [
+            serialize_tab(t, include_values=include_values, options_cache=options_cache)
+            for t in tabs
+        ],
         "groups": [serialize_group(g) for g in groups],
     }
 
@@ -1295,31 +1330,38 @@ def update_settings(tab_name: str, values: dict[str, Any]) -> dict[str, Any]:
             "requiresRestart": False,
         }
 
-    # Call on_save handler if registered (for custom validation/transformation)
-    on_save_handler = get_on_save_handler(tab_name)
-    if on_save_handler:
-        try:
-            result = on_save_handler(values_to_save.copy())
-            if result.get("error"):
+    # The on_save handler and save_config_file share one read of the tab's file
+    saving_token = _SAVING_TAB_CONFIG.set((tab_name, load_config_file(tab_name)))
+    try:
+        # Call on_save handler if registered (for custom validation/transformation)
+        on_save_handler = get_on_save_handler(tab_name)
+        if on_save_handler:
+            try:
+                result = on_save_handler(values_to_save.copy())
+                if result.get("error"):
+                    return {
+                        "success": False,
+                        "message": result.get("message", "Validation failed"),
+                        "updated": [],
+                        "requiresRestart": False,
+                    }
+                # Use the transformed values
+                values_to_save = result.get("values", values_to_save)
+            except Exception as e:
+                logger.exception("on_save handler for %s failed", tab_name)
                 return {
                     "success": False,
-                    "message": result.get("message", "Validation failed"),
+                    "message": f"Save handler error: {e!s}",
                     "updated": [],
                     "requiresRestart": False,
                 }
-            # Use the transformed values
-            values_to_save = result.get("values", values_to_save)
-        except Exception as e:
-            logger.exception("on_save handler for %s failed", tab_name)
-            return {
-                "success": False,
-                "message": f"Save handler error: {e!s}",
-                "updated": [],
-                "requiresRestart": False,
-            }
-
-    # Save to config file
-    if save_config_file(tab_name, values_to_save):
+
+        # Save to config file
+        saved = save_config_file(tab_name, values_to_save)
+    finally:
+        _SAVING_TAB_CONFIG.reset(saving_token)
+
+    if saved:
         # Refresh the config singleton so live settings take effect immediately
         config_obj = None
         try:
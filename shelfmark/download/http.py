@@ -126,6 +126,14 @@ def get_cf_user_agent_for_domain(domain: str) -> str | None:
     return _get_internal_bypasser().get_cf_user_agent_for_domain(domain)
 
 
+def get_cf_session_for_domain(domain: str) -> tuple[dict[str, str], str | None]:
+    """Get CF cookies and user agent together - only available with internal bypasser."""
+    if _is_using_external_bypasser():
+        logger.debug("External bypasser in use, CF session not available for %s", domain)
+        return {}, None
+    return _get_internal_bypasser().get_cf_session_for_domain(domain)
+
+
 def _apply_cf_bypass(url: str, headers: dict) -> dict:
     """Apply CF bypass cookies and user agent if available.
 
@@ -137,8 +145,7 @@ def _apply_cf_bypass(url: str, headers: dict) -> dict:
 
     parsed = urlparse(url)
     hostname = parsed.hostname or ""
-    cookies = get_cf_cookies_for_domain(hostname)
-    stored_ua = get_cf_user_agent_for_domain(hostname)
+    cookies, stored_ua = get_cf_session_for_domain(hostname)
     if stored_ua:
         headers["User-Agent"] = stored_ua
     return cookies
@@ -163,6 +163,9 @@ except ImportError:
 
 logger = setup_logger(__name__)
 _GETADDRINFO_SOCKADDR_INDEX = 4
+# Answers cached per custom resolver (honouring record TTLs); a DNS rotation
+# builds a fresh resolver, so stale answers don't survive a provider switch.
+_CUSTOM_DNS_CACHE_SIZE = 512
 
 
 def _call_dns_rotation_callback(
@@ -565,6 +568,7 @@ def create_custom_resolver(
     """Create a custom DNS resolver using the specified or configured DNS servers."""
     custom_resolver = dns.resolver.Resolver()
     custom_resolver.nameservers = servers if servers is not None else CUSTOM_DNS
+    custom_resolver.cache = dns.resolver.LRUCache(_CUSTOM_DNS_CACHE_SIZE)
     return custom_resolver
 
 
@@ -516,9 +516,21 @@ def is_provider_enabled(provider_name: str) -> bool:
     return app_config.get(enabled_key, False) is True
 
 
+def list_enabled_providers() -> list[dict]:
+    """For settings UI - list enabled providers, refreshing config only once."""
+    from shelfmark.core.config import config as app_config
+
+    app_config.refresh()
+    return [
+        info
+        for info in list_providers()
+        if app_config.get(f"{info['name'].upper()}_ENABLED", False) is True
+    ]
+
+
 def get_enabled_providers() -> list[str]:
     """Get list of all enabled provider names."""
-    return [name for name in _PROVIDERS if is_provider_enabled(name)]
+    return [info["name"] for info in list_enabled_providers()]
 
 
 def get_configured_provider(
@@ -4,6 +4,7 @@ from typing import Any
 
 import requests
 
+from shelfmark.core.logger import setup_logger
 from shelfmark.core.request_helpers import normalize_optional_text
 from shelfmark.core.settings_registry import (
     ActionButton,
@@ -17,6 +18,8 @@ from shelfmark.core.settings_registry import (
 )
 from shelfmark.core.utils import normalize_http_url
 
+logger = setup_logger(__name__)
+
 # ==================== Dynamic Options Loaders ====================
 
 _PROWLARR_SETTINGS_ERRORS = (
@@ -50,9 +53,6 @@ def _get_indexer_options() -> list[dict[str, str]]:
     Returns list of {value: "id", label: "name (protocol)"} options.
     """
     from shelfmark.core.config import config
-    from shelfmark.core.logger import setup_logger
-
-    logger = setup_logger(__name__)
 
     raw_url = normalize_optional_text(config.get("PROWLARR_URL", "")) or ""
     api_key = normalize_optional_text(config.get("PROWLARR_API_KEY", "")) or ""
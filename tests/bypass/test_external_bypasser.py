@@ -1,15 +1,27 @@
 """Tests for the external bypasser flow."""
 
+import json
+
+import pytest
+
 
 class _FakeResponse:
     def __init__(self, payload: dict) -> None:
-        self._payload = payload
+        self.content = json.dumps(payload).encode()
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.closed = True
 
     def raise_for_status(self) -> None:
         return None
 
-    def json(self) -> dict:
-        return self._payload
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
 
 
 def test_fetch_via_bypasser_posts_expected_payload_and_uses_ssl_verify(monkeypatch):
@@ -36,31 +48,52 @@ def test_fetch_via_bypasser_posts_expected_payload_and_uses_ssl_verify(monkeypat
         )
 
     monkeypatch.setattr(external_bypasser.config, "get", fake_get)
-    monkeypatch.setattr(external_bypasser.requests, "post", fake_post)
+    monkeypatch.setattr(external_bypasser._SESSION, "post", fake_post)
     monkeypatch.setattr(external_bypasser, "get_ssl_verify", lambda _url: False)
 
-    assert external_bypasser._fetch_via_bypasser("https://example.com/book") == "<html>ok</html>"
+    endpoint = external_bypasser._resolve_bypasser_endpoint()
+    assert endpoint is not None
+    assert external_bypasser._fetch_via_bypasser(endpoint, "https://example.com/book") == (
+        external_bypasser._FetchOutcome.OK,
+        "<html>ok</html>",
+    )
     assert calls == [
         {
             "url": "https://bypass.example/v1",
             "headers": {"Content-Type": "application/json"},
-            "json": {
-                "cmd": "request.get",
-                "url": "https://example.com/book",
-                "maxTimeout": 60000,
-            },
+            "data": b'{"cmd":"request.get","maxTimeout":60000,"url":"https://example.com/book"}',
             "timeout": (10, 75.0),
             "verify": False,
+            "stream": True,
         }
     ]
 
 
+def test_fetch_via_bypasser_rejects_oversized_body_and_closes_response(monkeypatch):
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    response = _FakeResponse({"status": "ok", "message": "", "solution": {"response": "x" * 4096}})
+    monkeypatch.setattr(external_bypasser, "MAX_BODY_BYTES", 1024)
+    monkeypatch.setattr(external_bypasser, "_BODY_CHUNK_BYTES", 256)
+    monkeypatch.setattr(external_bypasser._SESSION, "post", lambda *_a, **_k: response)
+
+    endpoint = external_bypasser._BypasserEndpoint(
+        post_url="http://flaresolverr:8191/v1", verify=True, timeout_ms=60000, read_timeout=75.0
+    )
+
+    assert external_bypasser._fetch_via_bypasser(endpoint, "https://example.com") == (
+        external_bypasser._FetchOutcome.FATAL,
+        None,
+    )
+    assert response.closed is True
+
+
 def test_get_bypassed_page_retries_and_rotates_selector_between_attempts(monkeypatch):
     import shelfmark.bypass.external_bypasser as external_bypasser
 
     class FakeRng:
-        def random(self) -> float:
-            return 0.0
+        def uniform(self, a: float, _b: float) -> float:
+            return a
 
     class FakeSelector:
         def __init__(self) -> None:
@@ -79,9 +112,12 @@ def test_get_bypassed_page_retries_and_rotates_selector_between_attempts(monkeyp
 
     fetch_calls: list[str] = []
     sleeps: list[float] = []
-    responses = [None, "<html>ok</html>"]
+    responses = [
+        (external_bypasser._FetchOutcome.RETRY, None),
+        (external_bypasser._FetchOutcome.OK, "<html>ok</html>"),
+    ]
 
-    def fake_fetch(url: str) -> str | None:
+    def fake_fetch(_endpoint, url: str):
         fetch_calls.append(url)
         return responses.pop(0)
 
@@ -101,3 +137,361 @@ def test_get_bypassed_page_retries_and_rotates_selector_between_attempts(monkeyp
     ]
     assert selector.rotate_calls == 1
     assert sleeps == [1.0]
+
+
+def test_get_bypassed_page_uses_capped_decorrelated_backoff(monkeypatch):
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    class FakeRng:
+        def __init__(self) -> None:
+            self.bounds: list[tuple[float, float]] = []
+
+        def uniform(self, a: float, b: float) -> float:
+            self.bounds.append((a, b))
+            return b
+
+    class FakeSelector:
+        def rewrite(self, url: str) -> str:
+            return url
+
+        def next_mirror_or_rotate_dns(self) -> tuple[str | None, str]:
+            return None, "exhausted"
+
+    sleeps: list[float] = []
+    rng = FakeRng()
+
+    monkeypatch.setattr(
+        external_bypasser,
+        "_fetch_via_bypasser",
+        lambda _endpoint, _url: (external_bypasser._FetchOutcome.RETRY, None),
+    )
+    monkeypatch.setattr(
+        external_bypasser, "_sleep_with_cancellation", lambda seconds, _flag: sleeps.append(seconds)
+    )
+    monkeypatch.setattr(external_bypasser, "_RNG", rng)
+
+    result = external_bypasser.get_bypassed_page("https://orig.example/book", FakeSelector())
+
+    assert result is None
+    assert sleeps == [3.0, 9.0, 10.0, 10.0]
+    assert rng.bounds == [(1.0, 3.0), (1.0, 9.0), (1.0, 27.0), (1.0, 30.0)]
+
+
+def test_endpoint_request_body_escapes_target_url():
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    endpoint = external_bypasser._BypasserEndpoint(
+        post_url="http://flaresolverr:8191/v1", verify=True, timeout_ms=30000, read_timeout=45.0
+    )
+
+    body = endpoint.request_body('https://example.com/search?q="dune"')
+
+    assert json.loads(body) == {
+        "cmd": "request.get",
+        "maxTimeout": 30000,
+        "url": 'https://example.com/search?q="dune"',
+    }
+
+
+def test_fetch_via_bypasser_classifies_permanent_failures(monkeypatch):
+    import requests
+
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    class _ErrorResponse:
+        def __init__(self, status_code: int) -> None:
+            self.status_code = status_code
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc) -> None:
+            return None
+
+        def raise_for_status(self) -> None:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error", response=self)
+
+    responses = [
+        _FakeResponse({"status": "error", "message": "Error: Invalid URL"}),
+        _FakeResponse({"status": "error", "message": "Error solving the challenge"}),
+        _FakeResponse({"status": "error", "message": "net::ERR_NAME_NOT_RESOLVED at https://x"}),
+        _ErrorResponse(400),
+        _ErrorResponse(429),
+        _ErrorResponse(503),
+        _FakeResponse({"status": "ok", "message": ""}),
+    ]
+
+    monkeypatch.setattr(external_bypasser._SESSION, "post", lambda *_a, **_k: responses.pop(0))
+
+    endpoint = external_bypasser._BypasserEndpoint(
+        post_url="http://flaresolverr:8191/v1", verify=True, timeout_ms=60000, read_timeout=75.0
+    )
+    outcomes = [
+        external_bypasser._fetch_via_bypasser(endpoint, "https://example.com")[0] for _ in range(7)
+    ]
+
+    fetch_outcome = external_bypasser._FetchOutcome
+    assert outcomes == [
+        fetch_outcome.FATAL,
+        fetch_outcome.RETRY,
+        fetch_outcome.MIRROR_DOWN,
+        fetch_outcome.FATAL,
+        fetch_outcome.RETRY,
+        fetch_outcome.RETRY,
+        fetch_outcome.RETRY,
+    ]
+
+
+def test_get_bypassed_page_stops_retrying_on_fatal_outcome(monkeypatch):
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    class FakeSelector:
+        def rewrite(self, url: str) -> str:
+            return url
+
+        def next_mirror_or_rotate_dns(self) -> tuple[str | None, str]:
+            raise AssertionError("should not rotate after a fatal failure")
+
+    fetch_calls: list[str] = []
+
+    def fake_fetch(_endpoint, url: str):
+        fetch_calls.append(url)
+        return external_bypasser._FetchOutcome.FATAL, None
+
+    def fail_sleep(_seconds: float, _flag) -> None:
+        raise AssertionError("should not back off after a fatal failure")
+
+    monkeypatch.setattr(external_bypasser, "_fetch_via_bypasser", fake_fetch)
+    monkeypatch.setattr(external_bypasser, "_sleep_with_cancellation", fail_sleep)
+
+    assert external_bypasser.get_bypassed_page("https://orig.example/book", FakeSelector()) is None
+    assert fetch_calls == ["https://orig.example/book"]
+
+
+def test_get_bypassed_page_skips_backoff_when_rotating_away_from_dead_mirror(monkeypatch):
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    class FakeSelector:
+        def __init__(self) -> None:
+            self.current_base = "https://mirror-one.example"
+
+        def rewrite(self, url: str) -> str:
+            return url.replace("https://orig.example", self.current_base, 1)
+
+        def next_mirror_or_rotate_dns(self) -> tuple[str | None, str]:
+            self.current_base = "https://mirror-two.example"
+            return self.current_base, "mirror"
+
+    responses = [
+        (external_bypasser._FetchOutcome.MIRROR_DOWN, None),
+        (external_bypasser._FetchOutcome.OK, "<html>ok</html>"),
+    ]
+    fetch_calls: list[str] = []
+    sleeps: list[float] = []
+
+    def fake_fetch(_endpoint, url: str):
+        fetch_calls.append(url)
+        return responses.pop(0)
+
+    monkeypatch.setattr(external_bypasser, "_fetch_via_bypasser", fake_fetch)
+    monkeypatch.setattr(
+        external_bypasser, "_sleep_with_cancellation", lambda seconds, _flag: sleeps.append(seconds)
+    )
+
+    result = external_bypasser.get_bypassed_page("https://orig.example/book", FakeSelector())
+
+    assert result == "<html>ok</html>"
+    assert fetch_calls == [
+        "https://mirror-one.example/book",
+        "https://mirror-two.example/book",
+    ]
+    assert sleeps == []
+
+
+def test_get_bypassed_page_resolves_endpoint_once_per_call(monkeypatch):
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    class FakeRng:
+        def uniform(self, a: float, _b: float) -> float:
+            return a
+
+    class FakeSelector:
+        def rewrite(self, url: str) -> str:
+            return url
+
+        def next_mirror_or_rotate_dns(self) -> tuple[str | None, str]:
+            return None, "exhausted"
+
+    endpoint = external_bypasser._BypasserEndpoint(
+        post_url="http://flaresolverr:8191/v1", verify=True, timeout_ms=60000, read_timeout=75.0
+    )
+    resolve_calls: list[None] = []
+    seen_endpoints: list[object] = []
+
+    def fake_resolve():
+        resolve_calls.append(None)
+        return endpoint
+
+    def fake_fetch(passed_endpoint, _url: str):
+        seen_endpoints.append(passed_endpoint)
+        return external_bypasser._FetchOutcome.RETRY, None
+
+    monkeypatch.setattr(external_bypasser, "_resolve_bypasser_endpoint", fake_resolve)
+    monkeypatch.setattr(external_bypasser, "_fetch_via_bypasser", fake_fetch)
+    monkeypatch.setattr(external_bypasser, "_sleep_with_cancellation", lambda _s, _f: None)
+    monkeypatch.setattr(external_bypasser, "_RNG", FakeRng())
+
+    assert external_bypasser.get_bypassed_page("https://orig.example/book", FakeSelector()) is None
+    assert len(resolve_calls) == 1
+    assert seen_endpoints == [endpoint] * external_bypasser.MAX_RETRY
+
+
+def test_get_bypassed_page_refetches_same_url_after_completion(monkeypatch):
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    class FakeSelector:
+        def rewrite(self, url: str) -> str:
+            return url
+
+    fetch_calls: list[str] = []
+
+    def fake_fetch(_endpoint, url: str):
+        fetch_calls.append(url)
+        return external_bypasser._FetchOutcome.OK, f"<html>{len(fetch_calls)}</html>"
+
+    monkeypatch.setattr(external_bypasser, "_fetch_via_bypasser", fake_fetch)
+
+    # Countdown and retry paths re-fetch the same URL expecting fresh content
+    first = external_bypasser.get_bypassed_page("https://orig.example/book", FakeSelector())
+    second = external_bypasser.get_bypassed_page("https://orig.example/book", FakeSelector())
+
+    assert (first, second) == ("<html>1</html>", "<html>2</html>")
+    assert fetch_calls == ["https://orig.example/book"] * 2
+
+
+def test_fetch_deduplicated_collapses_concurrent_requests(monkeypatch):
+    import threading
+
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    release = threading.Event()
+    fetch_calls: list[str] = []
+
+    def fake_fetch(_endpoint, url: str):
+        fetch_calls.append(url)
+        release.wait(5)
+        return external_bypasser._FetchOutcome.OK, "<html>shared</html>"
+
+    monkeypatch.setattr(external_bypasser, "_fetch_via_bypasser", fake_fetch)
+
+    endpoint = external_bypasser._BypasserEndpoint(
+        post_url="http://flaresolverr:8191/v1", verify=True, timeout_ms=60000, read_timeout=75.0
+    )
+    results: list[tuple] = []
+
+    def worker() -> None:
+        results.append(external_bypasser._fetch_deduplicated(endpoint, "https://example.com/a"))
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    threads[0].start()
+    while not fetch_calls:
+        threading.Event().wait(0.01)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert fetch_calls == ["https://example.com/a"]
+    assert results == [(external_bypasser._FetchOutcome.OK, "<html>shared</html>")] * 3
+    assert external_bypasser._inflight == {}
+
+
+def test_fetch_deduplicated_waiters_share_failure_and_honour_cancel(monkeypatch):
+    import threading
+
+    import shelfmark.bypass.external_bypasser as external_bypasser
+    from shelfmark.bypass import BypassCancelledError
+
+    release = threading.Event()
+    fetch_calls: list[str] = []
+
+    def fake_fetch(_endpoint, url: str):
+        fetch_calls.append(url)
+        release.wait(5)
+        return external_bypasser._FetchOutcome.MIRROR_DOWN, None
+
+    monkeypatch.setattr(external_bypasser, "_fetch_via_bypasser", fake_fetch)
+    monkeypatch.setattr(external_bypasser, "_INFLIGHT_WAIT_SLICE_SECONDS", 0.01)
+
+    endpoint = external_bypasser._BypasserEndpoint(
+        post_url="http://flaresolverr:8191/v1", verify=True, timeout_ms=60000, read_timeout=75.0
+    )
+    url = "https://example.com/failing"
+    results: list[tuple] = []
+
+    def worker() -> None:
+        results.append(external_bypasser._fetch_deduplicated(endpoint, url))
+
+    leader = threading.Thread(target=worker)
+    leader.start()
+    while not fetch_calls:
+        threading.Event().wait(0.01)
+
+    cancelled = threading.Event()
+    cancelled.set()
+    with pytest.raises(BypassCancelledError):
+        external_bypasser._fetch_deduplicated(endpoint, url, cancelled)
+
+    waiting = threading.Event()
+    real_check = external_bypasser._check_cancelled
+
+    def tracking_check(cancel_flag, context):
+        waiting.set()
+        real_check(cancel_flag, context)
+
+    monkeypatch.setattr(external_bypasser, "_check_cancelled", tracking_check)
+    waiter = threading.Thread(target=worker)
+    waiter.start()
+    assert waiting.wait(5)
+    release.set()
+    leader.join(5)
+    waiter.join(5)
+
+    assert fetch_calls == [url]
+    assert results == [(external_bypasser._FetchOutcome.MIRROR_DOWN, None)] * 2
+    assert external_bypasser._inflight == {}
+
+
+def test_sleep_with_cancellation_returns_immediately_when_cancelled():
+    import threading
+    import time
+
+    import shelfmark.bypass.external_bypasser as external_bypasser
+    from shelfmark.bypass import BypassCancelledError
+
+    cancel_flag = threading.Event()
+    threading.Timer(0.05, cancel_flag.set).start()
+
+    started = time.monotonic()
+    with pytest.raises(BypassCancelledError):
+        external_bypasser._sleep_with_cancellation(10.0, cancel_flag)
+
+    assert time.monotonic() - started < 5.0
+
+
+def test_sleep_with_cancellation_waits_full_duration_when_not_cancelled():
+    import threading
+
+    import shelfmark.bypass.external_bypasser as external_bypasser
+
+    waits: list[float] = []
+
+    class FakeEvent(threading.Event):
+        def wait(self, timeout=None):
+            waits.append(timeout)
+            return False
+
+    external_bypasser._sleep_with_cancellation(2.5, FakeEvent())
+
+    assert waits == [2.5]
@@ -29,6 +29,7 @@ def test_bypass_tries_all_methods_before_abort(monkeypatch):
         return None
 
     monkeypatch.setattr(internal_bypasser, "BYPASS_METHODS", methods)
+    monkeypatch.setattr(internal_bypasser, "_METHOD_STATS", {})
     monkeypatch.setattr(internal_bypasser, "_is_bypassed", _always_false)
     monkeypatch.setattr(internal_bypasser, "_detect_challenge_type", _always_ddos_guard)
     monkeypatch.setattr(internal_bypasser.asyncio, "sleep", _no_sleep)
@@ -38,6 +39,65 @@ def test_bypass_tries_all_methods_before_abort(monkeypatch):
     assert calls == [f"m{i}" for i in range(6)]
 
 
+def test_bypass_tries_historically_successful_method_first(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    calls: list[str] = []
+
+    def _make_method(name: str, *, succeeds: bool):
+        async def _method(_sb) -> bool:
+            calls.append(name)
+            return succeeds
+
+        _method.__name__ = name
+        return _method
+
+    methods = [_make_method(f"m{i}", succeeds=i == 2) for i in range(3)]
+
+    async def _always_false(*_args, **_kwargs) -> bool:
+        return False
+
+    async def _always_cloudflare(*_args, **_kwargs) -> str:
+        return "cloudflare"
+
+    async def _no_sleep(_seconds) -> None:
+        return None
+
+    monkeypatch.setattr(internal_bypasser, "BYPASS_METHODS", methods)
+    monkeypatch.setattr(internal_bypasser, "_METHOD_STATS", {})
+    monkeypatch.setattr(internal_bypasser, "_is_bypassed", _always_false)
+    monkeypatch.setattr(internal_bypasser, "_detect_challenge_type", _always_cloudflare)
+    monkeypatch.setattr(internal_bypasser.asyncio, "sleep", _no_sleep)
+
+    assert asyncio.run(internal_bypasser._bypass(object(), max_retries=5)) is True
+    assert calls == ["m0", "m1", "m2"]
+
+    calls.clear()
+    assert asyncio.run(internal_bypasser._bypass(object(), max_retries=5)) is True
+    assert calls == ["m2"]
+
+
+def test_sleep_with_cancellation_stops_soon_after_cancel(monkeypatch):
+    import threading
+
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+    from shelfmark.bypass import BypassCancelledError
+
+    cancel_flag = threading.Event()
+    sleeps: list[float] = []
+
+    async def _fake_sleep(seconds) -> None:
+        sleeps.append(seconds)
+        cancel_flag.set()
+
+    monkeypatch.setattr(internal_bypasser.asyncio, "sleep", _fake_sleep)
+
+    with pytest.raises(BypassCancelledError):
+        asyncio.run(internal_bypasser._sleep_with_cancellation(10, cancel_flag))
+
+    assert sleeps == [internal_bypasser._CANCEL_POLL_SECONDS]
+
+
 def test_extract_cookies_from_cdp_filters_and_stores_ua():
     import time
 
@@ -79,6 +139,83 @@ def test_extract_cookies_from_cdp_filters_and_stores_ua():
     cookies = internal_bypasser.get_cf_cookies_for_domain("example.com")
     assert cookies == {"cf_clearance": "abc"}
     assert internal_bypasser.get_cf_user_agent_for_domain("example.com") == "TestUA/1.0"
+    assert internal_bypasser.get_cf_session_for_domain("www.example.com") == (
+        {"cf_clearance": "abc"},
+        "TestUA/1.0",
+    )
+
+
+def test_extract_cookies_from_cdp_uses_user_agent_captured_at_launch():
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    class FakeCookie:
+        name = "cf_clearance"
+        value = "abc"
+        domain = "example.com"
+        path = "/"
+        expires = None
+        secure = True
+
+    class FakeCookies:
+        async def get_all(self, requests_cookie_format=False):
+            return [FakeCookie()]
+
+    class FakeDriver:
+        cookies = FakeCookies()
+        _shelfmark_user_agent = "LaunchUA/1.0"
+
+    class FakePage:
+        async def evaluate(self, _expr):
+            raise AssertionError("user agent should come from the driver")
+
+    internal_bypasser.clear_cf_cookies()
+    asyncio.run(
+        internal_bypasser._extract_cookies_from_cdp(FakeDriver(), FakePage(), "https://example.com")
+    )
+
+    assert internal_bypasser.get_cf_user_agent_for_domain("example.com") == "LaunchUA/1.0"
+
+
+def test_extract_cookies_from_cdp_queries_bypass_tab_for_target_url():
+    from types import SimpleNamespace
+
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    sent = []
+
+    class FakeCookies:
+        async def get_all(self, requests_cookie_format=False):
+            raise AssertionError("cookies should come from the bypass tab")
+
+    class FakeDriver:
+        cookies = FakeCookies()
+        _shelfmark_user_agent = "TestUA/1.0"
+
+    class FakePage:
+        async def send(self, command):
+            sent.append(next(command))
+            return [
+                SimpleNamespace(
+                    name="cf_clearance",
+                    value="abc",
+                    domain=".example.com",
+                    path="/",
+                    expires=-1,
+                    secure=True,
+                )
+            ]
+
+    internal_bypasser.clear_cf_cookies()
+    asyncio.run(
+        internal_bypasser._extract_cookies_from_cdp(
+            FakeDriver(), FakePage(), "https://www.example.com/book"
+        )
+    )
+
+    assert sent == [
+        {"method": "Network.getCookies", "params": {"urls": ["https://www.example.com/book"]}}
+    ]
+    assert internal_bypasser.get_cf_cookies_for_domain("example.com") == {"cf_clearance": "abc"}
 
 
 def test_extract_cookies_from_cdp_keeps_full_session_cookies_for_configured_zlib_domains(
@@ -164,14 +301,69 @@ def test_extract_cookies_from_cdp_normalizes_session_expiry():
         )
     )
 
-    stored = internal_bypasser._cf_cookies.get("example.com", {})
+    stored = internal_bypasser._cf_sessions["example.com"].cookies
     assert stored["cf_clearance"]["expiry"] is None
     assert internal_bypasser.get_cf_cookies_for_domain("example.com") == {"cf_clearance": "abc"}
 
     # Verify fallback to "expires" key for expiry checks
-    internal_bypasser._cf_cookies["example.com"]["cf_clearance"]["expires"] = int(time.time()) - 10
+    expired = dict(stored["cf_clearance"], expires=int(time.time()) - 10)
+    internal_bypasser._store_child_bypass_state(
+        {"cookies": {"example.com": {"cf_clearance": expired}}}
+    )
     assert internal_bypasser.get_cf_cookies_for_domain("example.com") == {}
 
+    # Expired domains are dropped from the store on the next write
+    internal_bypasser._store_child_bypass_state(
+        {"cookies": {"other.org": {"cf_clearance": dict(stored["cf_clearance"])}}}
+    )
+    assert "example.com" not in internal_bypasser._cf_sessions
+
+
+@pytest.mark.parametrize(
+    ("hostname", "expected"),
+    [
+        ("www.example.com", "example.com"),
+        ("a.b.example.co", "example.co"),
+        ("example.com", "example.com"),
+        ("localhost", "localhost"),
+        ("", ""),
+    ],
+)
+def test_get_base_domain(hostname, expected):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    assert internal_bypasser._get_base_domain(hostname) == expected
+
+
+def test_cf_cookie_store_evicts_least_recently_used_domain(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    def _state(*domains):
+        return {
+            "cookies": {domain: {"cf_clearance": {"value": domain}} for domain in domains},
+            "user_agents": {domain: f"UA-{domain}" for domain in domains},
+        }
+
+    monkeypatch.setattr(internal_bypasser, "_CF_MAX_DOMAINS", 2)
+    internal_bypasser.clear_cf_cookies()
+
+    internal_bypasser._store_child_bypass_state(_state("a.com", "b.com"))
+    assert internal_bypasser.get_cf_cookies_for_domain("a.com") == {"cf_clearance": "a.com"}
+    internal_bypasser._store_child_bypass_state(_state("c.com"))
+
+    assert list(internal_bypasser._cf_sessions) == ["a.com", "c.com"]
+    # Cookies and UA are evicted together and never drift apart
+    assert internal_bypasser.get_cf_session_for_domain("b.com") == ({}, None)
+    assert internal_bypasser.get_cf_session_for_domain("a.com") == (
+        {"cf_clearance": "a.com"},
+        "UA-a.com",
+    )
+    assert internal_bypasser._child_bypass_state()["user_agents"] == {
+        "a.com": "UA-a.com",
+        "c.com": "UA-c.com",
+    }
+    internal_bypasser.clear_cf_cookies()
+
 
 def test_get_page_info_returns_safe_defaults_on_cdp_errors():
     from seleniumbase.undetected.cdp_driver.connection import ProtocolException
@@ -195,6 +387,39 @@ def test_get_page_info_returns_safe_defaults_on_cdp_errors():
     assert current_url == ""
 
 
+def test_get_page_info_reads_all_fields_in_one_evaluate():
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    calls = []
+
+    class FakePage:
+        async def evaluate(self, expr):
+            calls.append(expr)
+            return ["Just A Moment", "Checking BROWSER", "https://example.com/Path"]
+
+    info = asyncio.run(internal_bypasser._get_page_info(FakePage()))
+
+    assert info == ("just a moment", "checking browser", "https://example.com/Path")
+    assert len(calls) == 1
+
+
+def test_detect_challenge_type_prefers_ddos_guard_indicators(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    async def _page_info(_page):
+        return "ddos-guard", "just a moment...", "https://example.com/"
+
+    monkeypatch.setattr(internal_bypasser, "_get_page_info", _page_info)
+
+    assert asyncio.run(internal_bypasser._detect_challenge_type(object())) == "ddos_guard"
+    assert (
+        internal_bypasser._check_indicators(
+            "", "please verify you are human", internal_bypasser._PROTECTION_PATTERN
+        )
+        == "verify you are human"
+    )
+
+
 def test_create_cdp_browser_times_out_and_cleans_up(monkeypatch):
     import shelfmark.bypass.internal_bypasser as internal_bypasser
 
@@ -246,6 +471,337 @@ def test_create_cdp_browser_wraps_plain_startup_exception_and_cleans_up(monkeypa
     assert cleanup_calls == ["cleanup"]
 
 
+def test_browser_pool_reuses_browser_for_same_proxy(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    created = []
+    closed = []
+
+    async def _create(url):
+        created.append(url)
+        return object()
+
+    async def _close(driver):
+        closed.append(driver)
+
+    monkeypatch.setattr(internal_bypasser, "_create_cdp_browser", _create)
+    monkeypatch.setattr(internal_bypasser, "_close_cdp_driver", _close)
+    monkeypatch.setattr(internal_bypasser, "_get_proxy_string", lambda _url: None)
+    monkeypatch.setattr(internal_bypasser, "_start_debug_recording", lambda _driver: None)
+
+    pool = internal_bypasser._BrowserPool(idle_timeout=60, max_idle=1)
+
+    async def _scenario():
+        first = await pool.acquire("https://example.com")
+        await pool.release(first, "https://example.com")
+        second = await pool.acquire("https://example.com/other")
+        await pool.close_all()
+        return first, second
+
+    first, second = asyncio.run(_scenario())
+
+    assert first is second
+    assert created == ["https://example.com"]
+    assert closed == []
+
+
+def test_browser_pool_closes_browsers_after_dns_rotation(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    closed = []
+
+    async def _create(_url):
+        return object()
+
+    async def _close(driver):
+        closed.append(driver)
+
+    monkeypatch.setattr(internal_bypasser, "_create_cdp_browser", _create)
+    monkeypatch.setattr(internal_bypasser, "_close_cdp_driver", _close)
+    monkeypatch.setattr(internal_bypasser, "_get_proxy_string", lambda _url: None)
+    monkeypatch.setattr(internal_bypasser, "_start_debug_recording", lambda _driver: None)
+
+    pool = internal_bypasser._BrowserPool(idle_timeout=60, max_idle=1)
+
+    async def _scenario():
+        first = await pool.acquire("https://example.com")
+        await pool.release(first, "https://example.com")
+        pool.invalidate("cloudflare", ["1.1.1.1"], None)
+        second = await pool.acquire("https://example.com")
+        await pool.close_all()
+        return first, second
+
+    first, second = asyncio.run(_scenario())
+
+    assert first is not second
+    assert closed == [first]
+
+
+@pytest.mark.parametrize(("page", "released"), [("<html>ok</html>", True), ("", False)])
+def test_run_bypass_only_pools_browsers_that_cleared_the_page(monkeypatch, page, released):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    driver = object()
+    returned: list[object] = []
+    closed: list[object] = []
+
+    class FakePool:
+        async def acquire(self, _url):
+            return driver
+
+        async def release(self, pooled_driver, _url):
+            returned.append(pooled_driver)
+
+    class FakeWorker:
+        def run(self, coro, **_kwargs):
+            return asyncio.run(coro)
+
+    async def _get(*_args, **_kwargs):
+        return page
+
+    async def _close(closed_driver):
+        closed.append(closed_driver)
+
+    monkeypatch.delenv(internal_bypasser._BYPASS_CHILD_ENV, raising=False)
+    monkeypatch.setattr(internal_bypasser, "_BROWSER_POOL", FakePool())
+    monkeypatch.setattr(internal_bypasser, "_CDP_WORKER", FakeWorker())
+    monkeypatch.setattr(internal_bypasser, "_get", _get)
+    monkeypatch.setattr(internal_bypasser, "_close_cdp_driver", _close)
+
+    result = internal_bypasser._run_bypass_in_current_process("https://example.com/", 2)
+
+    assert result == page
+    assert returned == ([driver] if released else [])
+    assert closed == ([] if released else [driver])
+
+
+def test_domain_lock_is_shared_per_base_domain_and_dropped_when_unused():
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    with internal_bypasser._domain_lock("www.example.com"):
+        entry = internal_bypasser._domain_locks["example.com"]
+        # Another host under the same base domain would have to wait
+        assert entry.lock.acquire(blocking=False) is False
+        with internal_bypasser._domain_lock("example.org"):
+            assert set(internal_bypasser._domain_locks) == {"example.com", "example.org"}
+
+    assert internal_bypasser._domain_locks == {}
+
+
+def test_get_does_not_block_other_domains_during_bypass(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    monkeypatch.setattr(internal_bypasser.env, "DOCKERMODE", False)
+    monkeypatch.setattr(internal_bypasser, "_try_with_cached_cookies", lambda *_args: None)
+
+    def _fake_run(url, _retry, _cancel_flag, **_kwargs):
+        if "example.com" in url:
+            # Still holding example.com's lock: a different domain must not wait on it.
+            return internal_bypasser.get("https://example.org/", retry=1) + "+com"
+        return "org"
+
+    monkeypatch.setattr(internal_bypasser, "_run_bypass_in_current_process", _fake_run)
+
+    assert internal_bypasser.get("https://example.com/", retry=1) == "org+com"
+
+
+def test_get_runs_docker_helpers_for_different_domains_concurrently(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    monkeypatch.setattr(internal_bypasser.env, "DOCKERMODE", True)
+    monkeypatch.delenv(internal_bypasser._BYPASS_CHILD_ENV, raising=False)
+    monkeypatch.setattr(internal_bypasser, "_try_with_cached_cookies", lambda *_args: None)
+    swept = []
+    monkeypatch.setattr(internal_bypasser, "_cleanup_orphan_processes", lambda: swept.append(1))
+
+    def _fake_helper(url, _retry):
+        if "example.com" in url:
+            # example.com's helper is still live: example.org's must start anyway.
+            return internal_bypasser.get("https://example.org/", retry=1) + "+com"
+        msg = "helper failed"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(internal_bypasser, "_run_helper_process", _fake_helper)
+
+    with pytest.raises(RuntimeError, match="helper failed"):
+        internal_bypasser.get("https://example.com/", retry=1)
+
+    # The failed helper's sweep waits until its sibling has exited too
+    assert swept == [1]
+    assert internal_bypasser._active_helpers == 0
+
+
+def test_get_skips_cookie_retry_the_caller_already_made(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    cookies = {"cf_clearance": "token"}
+    monkeypatch.setattr(internal_bypasser.env, "DOCKERMODE", False)
+    monkeypatch.setattr(
+        internal_bypasser, "get_cf_session_for_domain", lambda _host: (dict(cookies), "UA/1.0")
+    )
+    retried: list[tuple[dict[str, str], str | None] | None] = []
+    monkeypatch.setattr(
+        internal_bypasser,
+        "_try_with_cached_cookies",
+        lambda _url, _host, tried=None: retried.append(tried),
+    )
+    monkeypatch.setattr(
+        internal_bypasser, "_run_bypass_in_current_process", lambda *_a, **_k: "bypassed"
+    )
+
+    class FakeSelector:
+        def rewrite(self, url):
+            return url
+
+    result = internal_bypasser.get_bypassed_page("https://example.com/", FakeSelector())
+
+    assert result == "bypassed"
+    assert retried == [(cookies, "UA/1.0")]
+
+
+def test_cleanup_orphan_processes_kills_matching_command_lines(monkeypatch, tmp_path):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    for pid, cmdline in {
+        "101": b"/usr/bin/chromium\x00--headless\x00",
+        "102": b"Xvfb\x00:99\x00",
+        "103": b"python\x00-m\x00shelfmark\x00",
+    }.items():
+        (tmp_path / pid).mkdir()
+        (tmp_path / pid / "cmdline").write_bytes(cmdline)
+    (tmp_path / "self").mkdir()
+
+    killed = []
+
+    monkeypatch.setattr(internal_bypasser.env, "DOCKERMODE", True)
+    monkeypatch.setattr(internal_bypasser, "_PROC_DIR", str(tmp_path))
+    monkeypatch.setattr(internal_bypasser, "_stop_ffmpeg_recording", lambda: None)
+    monkeypatch.setattr(internal_bypasser.time, "sleep", lambda _seconds: None)
+    monkeypatch.setattr(internal_bypasser.os, "kill", lambda pid, sig: killed.append((pid, sig)))
+
+    assert internal_bypasser._cleanup_orphan_processes() == 2
+    assert sorted(killed) == [
+        (101, internal_bypasser.signal.SIGKILL),
+        (102, internal_bypasser.signal.SIGKILL),
+    ]
+
+
+def test_cleanup_orphan_processes_in_helper_only_kills_its_own_tree(monkeypatch, tmp_path):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    helper_pid = internal_bypasser.os.getpid()
+    for pid, (ppid, cmdline) in {
+        "201": (helper_pid, b"Xvfb\x00:99\x00"),
+        "202": (201, b"/usr/bin/chromium\x00--type=renderer\x00"),
+        "301": (1, b"/usr/bin/chromium\x00--headless\x00"),
+    }.items():
+        (tmp_path / pid).mkdir()
+        (tmp_path / pid / "cmdline").write_bytes(cmdline)
+        (tmp_path / pid / "stat").write_bytes(f"{pid} (my proc) S {ppid} 0 0".encode())
+
+    killed = []
+
+    monkeypatch.setattr(internal_bypasser.env, "DOCKERMODE", True)
+    monkeypatch.setenv(internal_bypasser._BYPASS_CHILD_ENV, "1")
+    monkeypatch.setattr(internal_bypasser, "_PROC_DIR", str(tmp_path))
+    monkeypatch.setattr(internal_bypasser, "_stop_ffmpeg_recording", lambda: None)
+    monkeypatch.setattr(internal_bypasser.time, "sleep", lambda _seconds: None)
+    monkeypatch.setattr(internal_bypasser.os, "kill", lambda pid, _sig: killed.append(pid))
+
+    assert internal_bypasser._cleanup_orphan_processes() == 2
+    assert sorted(killed) == [201, 202]
+
+
+def test_build_host_resolver_rules_reuses_lookups_until_dns_rotation(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    lookups = []
+
+    def _getaddrinfo(hostname, port, family):
+        lookups.append(hostname)
+        return [(family, None, None, "", ("10.0.0.1", port))]
+
+    monkeypatch.setattr(
+        internal_bypasser.network, "get_available_aa_urls", lambda: ["https://annas-archive.org"]
+    )
+    monkeypatch.setattr(internal_bypasser.socket, "getaddrinfo", _getaddrinfo)
+    internal_bypasser._invalidate_host_resolver_rules()
+
+    assert internal_bypasser._build_host_resolver_rules() == ["MAP annas-archive.org 10.0.0.1"]
+    assert internal_bypasser._build_host_resolver_rules() == ["MAP annas-archive.org 10.0.0.1"]
+    assert lookups == ["annas-archive.org"]
+
+    internal_bypasser._invalidate_host_resolver_rules("cloudflare", ["1.1.1.1"], None)
+    internal_bypasser._build_host_resolver_rules()
+    assert lookups == ["annas-archive.org", "annas-archive.org"]
+    internal_bypasser._invalidate_host_resolver_rules()
+
+
+def test_stop_ffmpeg_recording_escalates_to_kill(monkeypatch):
+    import subprocess
+
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    class StuckProcess:
+        def __init__(self):
+            self.signals = []
+            self.killed = False
+
+        def poll(self):
+            return None
+
+        def send_signal(self, sig):
+            self.signals.append(sig)
+
+        def wait(self, timeout=None):
+            raise subprocess.TimeoutExpired("ffmpeg", timeout)
+
+        def kill(self):
+            self.killed = True
+
+    proc = StuckProcess()
+    monkeypatch.setitem(internal_bypasser.DISPLAY, "ffmpeg", proc)
+    monkeypatch.setitem(internal_bypasser.DISPLAY, "ffmpeg_output", None)
+
+    internal_bypasser._stop_ffmpeg_recording()
+
+    signal = internal_bypasser.signal
+    assert proc.signals == [signal.SIGINT, signal.SIGTERM]
+    assert proc.killed is True
+    assert internal_bypasser.DISPLAY["ffmpeg"] is None
+
+
+def test_stop_driver_recording_only_stops_the_owners_recording(monkeypatch):
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    class ExitingProcess:
+        def __init__(self):
+            self.signals = []
+
+        def poll(self):
+            return 0 if self.signals else None
+
+        def send_signal(self, sig):
+            self.signals.append(sig)
+
+    class FakeDriver:
+        pass
+
+    proc = ExitingProcess()
+    owner, other = FakeDriver(), FakeDriver()
+    setattr(owner, internal_bypasser._DRIVER_RECORDING_ATTR, True)
+    monkeypatch.setitem(internal_bypasser.DISPLAY, "ffmpeg", proc)
+    monkeypatch.setitem(internal_bypasser.DISPLAY, "ffmpeg_output", None)
+
+    asyncio.run(internal_bypasser._stop_driver_recording(other))
+    assert internal_bypasser.DISPLAY["ffmpeg"] is proc
+    assert proc.signals == []
+
+    asyncio.run(internal_bypasser._stop_driver_recording(owner))
+    assert internal_bypasser.DISPLAY["ffmpeg"] is None
+    assert proc.signals == [internal_bypasser.signal.SIGINT]
+
+
 def test_run_child_process_writes_failure_for_unexpected_exception(monkeypatch, tmp_path):
     import io
     import json
@@ -274,6 +830,48 @@ def test_run_child_process_writes_failure_for_unexpected_exception(monkeypatch,
     assert "plain SeleniumBase startup failure" in result["traceback"]
 
 
+def test_docker_helper_reports_method_stats_back_to_parent(monkeypatch, tmp_path):
+    import io
+    import json
+
+    import shelfmark.bypass.internal_bypasser as internal_bypasser
+
+    async def _cdp_click(_page) -> bool:
+        return True
+
+    monkeypatch.setattr(internal_bypasser, "_METHOD_STATS", {})
+    internal_bypasser._METHOD_STATS[("cloudflare", "_cdp_click")] = (2, 3)
+    parent_rows = internal_bypasser._method_stats_since()
+
+    # Helper side: seeded with the parent's stats, reports only its own attempts
+    monkeypatch.setattr(internal_bypasser, "_METHOD_STATS", {})
+    result_path = tmp_path / "result.json"
+    request = {
+        "url": "https://example.com",
+        "retry": 1,
+        "result_path": str(result_path),
+        "method_stats": parent_rows,
+    }
+
+    def _fake_get(*_args, **_kwargs):
+        assert internal_bypasser._METHOD_STATS == {("cloudflare", "_cdp_click"): (2, 3)}
+        internal_bypasser._record_bypass_result("cloudflare", _cdp_click, succeeded=True)
+        return "<html>ok</html>"
+
+    monkeypatch.setattr(internal_bypasser, "get", _fake_get)
+    monkeypatch.setattr(internal_bypasser.sys, "stdin", io.StringIO(json.dumps(request)))
+
+    assert internal_bypasser._run_child_process() == 0
+    result = json.loads(result_path.read_text(encoding="utf-8"))
+    assert result["method_stats"] == [["cloudflare", "_cdp_click", 1, 1]]
+
+    # Parent side: the reported attempts are added to the parent's stats
+    monkeypatch.setattr(internal_bypasser, "_METHOD_STATS", {})
+    internal_bypasser._merge_method_stats(parent_rows)
+    internal_bypasser._merge_method_stats(result["method_stats"])
+    assert internal_bypasser._METHOD_STATS == {("cloudflare", "_cdp_click"): (3, 4)}
+
+
 def test_run_child_process_applies_parent_dns_config(monkeypatch, tmp_path):
     """Regression test for issue #1028: the helper subprocess must mirror the parent's
     DNS provider, otherwise it pre-resolves AA hostnames against (possibly hijacked)
@@ -373,21 +971,27 @@ def test_try_with_cached_cookies_returns_none_on_request_exception(monkeypatch):
     import shelfmark.bypass.internal_bypasser as internal_bypasser
 
     internal_bypasser.clear_cf_cookies()
-    internal_bypasser._cf_cookies["example.com"] = {
-        "cf_clearance": {
-            "value": "abc",
-            "domain": "example.com",
-            "path": "/",
-            "expiry": int(time.time()) + 3600,
-            "secure": True,
-            "httpOnly": True,
+    internal_bypasser._store_child_bypass_state(
+        {
+            "cookies": {
+                "example.com": {
+                    "cf_clearance": {
+                        "value": "abc",
+                        "domain": "example.com",
+                        "path": "/",
+                        "expiry": int(time.time()) + 3600,
+                        "secure": True,
+                        "httpOnly": True,
+                    }
+                }
+            }
         }
-    }
+    )
 
     def _raise(*_args, **_kwargs):
         raise requests.RequestException("boom")
 
-    monkeypatch.setattr(internal_bypasser.requests, "get", _raise)
+    monkeypatch.setattr(internal_bypasser._CACHED_COOKIE_SESSION, "get", _raise)
 
     assert internal_bypasser._try_with_cached_cookies("https://example.com", "example.com") is None
 
@@ -410,7 +1014,7 @@ def test_get_bypassed_page_retries_next_mirror_after_runtime_error(monkeypatch):
 
     calls: list[str] = []
 
-    def _fake_get(url, retry=None, cancel_flag=None):
+    def _fake_get(url, retry=None, cancel_flag=None, **_kwargs):
         del retry, cancel_flag
         calls.append(url)
         if len(calls) == 1:
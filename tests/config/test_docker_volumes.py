@@ -31,6 +31,59 @@ def test_save_config_file_merges_existing_values_and_preserves_unknown_keys(tmp_
     }
 
 
+def test_load_config_file_sees_same_size_rewrite_with_unchanged_mtime(tmp_path: Path):
+    from shelfmark.core.settings_registry import load_config_file
+
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir(parents=True)
+    config_path = plugins_dir / "downloads.json"
+    config_path.write_text('{"value": 1}')
+    original = config_path.stat()
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("shelfmark.config.env.CONFIG_DIR", tmp_path)
+        assert load_config_file("downloads") == {"value": 1}
+
+        config_path.write_text('{"value": 2}')
+        os.utime(config_path, ns=(original.st_atime_ns, original.st_mtime_ns))
+        assert config_path.stat().st_size == original.st_size
+
+        assert load_config_file("downloads") == {"value": 2}
+
+
+def test_update_settings_reads_the_tab_config_once_per_save(tmp_path: Path):
+    import json
+
+    import shelfmark.config.settings  # noqa: F401
+    from shelfmark.core.config import config as config_obj
+    from shelfmark.core.settings_registry import load_config_file, update_settings
+
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir(parents=True)
+    (plugins_dir / "downloads.json").write_text('{"unknown": "kept"}')
+    real_load = json.load
+    loads: list[str] = []
+
+    def counting_load(fp, *args, **kwargs):
+        loads.append(Path(fp.name).name)
+        return real_load(fp, *args, **kwargs)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("shelfmark.config.env.CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(config_obj, "refresh", lambda: None)
+        monkeypatch.setattr(json, "load", counting_load)
+
+        result = update_settings("downloads", {"DOWNLOAD_TO_BROWSER_CONTENT_TYPES": ["book"]})
+        assert result["success"] is True
+        assert loads == ["downloads.json"]
+
+        # Outside a save, reads go back to the file
+        assert load_config_file("downloads") == {
+            "unknown": "kept",
+            "DOWNLOAD_TO_BROWSER_CONTENT_TYPES": ["book"],
+        }
+
+
 @pytest.mark.parametrize(
     ("filename", "contents"),
     [
@@ -88,6 +141,28 @@ def test_is_config_dir_writable_tracks_directory_state(tmp_path: Path):
         assert _is_config_dir_writable() is False
 
 
+def test_is_config_dir_writable_caches_probe_per_directory(tmp_path: Path):
+    from shelfmark.config import env
+
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    probes: list[object] = []
+    real_access = os.access
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("shelfmark.config.env.CONFIG_DIR", config_dir)
+        monkeypatch.setattr(
+            env.os, "access", lambda path, mode: probes.append(path) or real_access(path, mode)
+        )
+        assert env._is_config_dir_writable() is True
+        assert env._is_config_dir_writable() is True
+        assert probes == [config_dir]
+
+        monkeypatch.setattr(env, "_CONFIG_DIR_WRITABLE_TTL_SECONDS", 0.0)
+        assert env._is_config_dir_writable() is True
+        assert probes == [config_dir, config_dir]
+
+
 @pytest.mark.skipif(
     hasattr(os, "geteuid") and os.geteuid() == 0, reason="Permission tests are unreliable as root"
 )
@@ -1,5 +1,7 @@
 from unittest.mock import patch
 
+import pytest
+
 
 def _base_email_mode_values() -> dict[str, object]:
     return {
@@ -41,6 +43,29 @@ def test_on_save_downloads_validates_default_email_recipient_format(monkeypatch)
     assert "valid plain email address" in result["message"]
 
 
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"EMAIL_SMTP_PORT": "abc"}, "SMTP port must be a number"),
+        ({"EMAIL_SMTP_PORT": "70000"}, "SMTP port must be between 1 and 65535"),
+        ({"EMAIL_SMTP_TIMEOUT_SECONDS": "0"}, "SMTP timeout (seconds) must be >= 1"),
+        (
+            {"EMAIL_ATTACHMENT_SIZE_LIMIT_MB": None},
+            "Attachment size limit (MB) must be a number",
+        ),
+    ],
+)
+def test_on_save_downloads_rejects_invalid_smtp_numbers(monkeypatch, overrides, message):
+    from shelfmark.config.settings import _on_save_downloads
+
+    monkeypatch.setattr("shelfmark.config.settings.load_config_file", lambda _tab: {})
+
+    result = _on_save_downloads({**_base_email_mode_values(), **overrides})
+
+    assert result["error"] is True
+    assert result["message"] == message
+
+
 def test_download_settings_email_recipient_field_uses_default_label():
     from shelfmark.config.settings import download_settings
 
@@ -429,3 +454,64 @@ def test_slow_source_options_lock_entries_until_mirror_dependencies_exist(monkey
     assert options["welib"]["disabledReason"] == "Add at least one Welib mirror in Mirrors"
     assert options["zlib"]["isLocked"] is True
     assert options["zlib"]["disabledReason"] == "Add at least one Z-Library mirror in Mirrors"
+
+
+def test_serialize_tab_builds_shared_option_lists_once():
+    from shelfmark.core import settings_registry
+    from shelfmark.core.settings_registry import SelectField, SettingsTab
+
+    calls: list[str] = []
+
+    def _options():
+        calls.append("built")
+        return [{"value": "a", "label": "A"}]
+
+    tab = SettingsTab(
+        name="downloads",
+        display_name="Downloads",
+        fields=[
+            SelectField(key="FIRST_SOURCE", label="First", options=_options),
+            SelectField(key="SECOND_SOURCE", label="Second", options=_options),
+        ],
+    )
+
+    serialized = settings_registry.serialize_tab(tab, include_values=False)
+
+    assert calls == ["built"]
+    assert [field["options"] for field in serialized["fields"]] == [
+        [{"value": "a", "label": "A"}],
+        [{"value": "a", "label": "A"}],
+    ]
+
+
+def test_on_save_advanced_cleans_remote_path_mappings_idempotently():
+    from shelfmark.config.settings import _on_save_advanced
+
+    cleaned = [{"host": "qbit", "remotePath": "/downloads", "localPath": "/data"}]
+
+    unchanged = _on_save_advanced({"PROWLARR_REMOTE_PATH_MAPPINGS": list(cleaned)})
+    edited = _on_save_advanced(
+        {
+            "PROWLARR_REMOTE_PATH_MAPPINGS": [
+                {"host": " QBit ", "remotePath": "/downloads", "localPath": "/data"},
+                {"host": "", "remotePath": "/x", "localPath": "/y"},
+            ]
+        }
+    )
+
+    assert unchanged == {"error": False, "values": {"PROWLARR_REMOTE_PATH_MAPPINGS": cleaned}}
+    assert edited["values"]["PROWLARR_REMOTE_PATH_MAPPINGS"] == cleaned
+
+
+def test_on_save_downloads_skips_checks_unrelated_to_saved_keys(monkeypatch):
+    from shelfmark.config.settings import _on_save_downloads
+
+    persisted = {**_base_email_mode_values(), "EMAIL_SMTP_HOST": ""}
+    monkeypatch.setattr("shelfmark.config.settings.load_config_file", lambda _tab: persisted)
+
+    result = _on_save_downloads({"DOWNLOAD_TO_BROWSER_CONTENT_TYPES": ["book"]})
+    assert result["error"] is False
+
+    result = _on_save_downloads({"EMAIL_SMTP_PORT": "465"})
+    assert result["error"] is True
+    assert result["message"] == "SMTP host is required"
@@ -317,6 +317,24 @@ class TestConfigValidation:
                 monkeypatch.setenv("FLASK_PORT", original_port)
             importlib.reload(env_module)
 
+    def test_is_sqlite_file_checks_header_without_stat(self, tmp_path):
+        """Only readable files with the SQLite header should be accepted."""
+        from shelfmark.config.env import _is_sqlite_file
+
+        db_file = tmp_path / "app.db"
+        db_file.write_bytes(b"SQLite format 3\x00" + b"\x00" * 84)
+        text_file = tmp_path / "notes.txt"
+        text_file.write_text("not a database")
+
+        assert _is_sqlite_file(db_file) is True
+        assert _is_sqlite_file(text_file) is False
+        assert _is_sqlite_file(tmp_path) is False
+        assert _is_sqlite_file(tmp_path / "missing.db") is False
+
+        fifo = tmp_path / "pipe.db"
+        os.mkfifo(fifo)
+        assert _is_sqlite_file(fifo) is False
+
     def test_missing_required_directory_handling(self):
         """Application should handle missing directories gracefully."""
         from shelfmark.download.staging import get_staging_dir
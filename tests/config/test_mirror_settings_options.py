@@ -9,3 +9,18 @@ def test_aa_base_url_options_include_configured_custom_url(monkeypatch):
 
     options = settings._get_aa_base_url_options()
     assert any(opt["value"] == "https://custom-aa.example" for opt in options)
+
+
+def test_on_save_mirrors_normalizes_and_dedupes_in_order():
+    from shelfmark.config.settings import _on_save_mirrors
+
+    result = _on_save_mirrors(
+        {
+            "AA_MIRROR_URLS": "b.example, auto, https://a.example/, b.example",
+            "LIBGEN_MIRROR_URLS": ["http://l.example", " ", "http://l.example"],
+        }
+    )
+
+    assert result["error"] is False
+    assert result["values"]["AA_MIRROR_URLS"] == ["https://b.example", "https://a.example"]
+    assert result["values"]["LIBGEN_MIRROR_URLS"] == ["http://l.example"]
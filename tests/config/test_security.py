@@ -207,6 +207,25 @@ class TestSecurityMigration:
         assert "PROXY_AUTH_RESTRICT_SETTINGS_TO_ADMIN" not in migrated
         mock_save_config.assert_called_with("users", {"RESTRICT_SETTINGS_TO_ADMIN": False})
 
+    @pytest.mark.parametrize(
+        ("auth_method", "generic_value", "expected"),
+        [("proxy", True, False), ("cwa", False, True), ("builtin", True, True)],
+    )
+    def test_legacy_restriction_prefers_auth_method_key(self, auth_method, generic_value, expected):
+        """The active auth method's key wins, then the generic key."""
+        from shelfmark.config.migrations import _pick_legacy_settings_restriction
+
+        config = {
+            "AUTH_METHOD": auth_method,
+            "PROXY_AUTH_RESTRICT_SETTINGS_TO_ADMIN": "no",
+            "CWA_RESTRICT_SETTINGS_TO_ADMIN": "yes",
+            "RESTRICT_SETTINGS_TO_ADMIN": generic_value,
+        }
+
+        assert _pick_legacy_settings_restriction(config) is expected
+        assert _pick_legacy_settings_restriction({"CWA_RESTRICT_SETTINGS_TO_ADMIN": 1}) is True
+        assert _pick_legacy_settings_restriction({}) is None
+
     def test_migrate_preserves_existing_auth_method(self, temp_config_dir, mock_logger):
         """Existing AUTH_METHOD should not be overwritten."""
         config_file = temp_config_dir / "config.json"
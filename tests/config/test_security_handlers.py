@@ -22,9 +22,9 @@ def _mock_response(payload):
 
 
 def _run_check(responses):
-    """Run check_oidc_connection with requests.get returning the given responses."""
+    """Run check_oidc_connection with Session.get returning the given responses."""
     with (
-        patch("requests.get", side_effect=responses) as mock_get,
+        patch("requests.Session.get", side_effect=responses) as mock_get,
         patch("shelfmark.config.security_handlers.get_ssl_verify", return_value=True),
     ):
         result = check_oidc_connection(
@@ -219,6 +219,21 @@ class TestParseNamingTemplate:
         )
         assert result == "Brandon Sanderson/The Way of Kings"
 
+    def test_reused_template_renders_each_value_set(self):
+        """A template rendered repeatedly reflects each call's values, not earlier ones."""
+        template = "{Author} - {Title}{ - Part }{PartNumber}{ (Vol. SeriesPosition)}"
+        cases = [
+            ({"Author": "A", "Title": "T"}, "A - T"),
+            ({"Author": "B", "Title": "U", "PartNumber": "02"}, "B - U - Part 02"),
+            ({"Author": "C", "Title": "V", "SeriesPosition": 3}, "C - V (Vol. 3)"),
+            ({"Author": "A", "Title": "T"}, "A - T"),
+        ]
+        for values, expected in cases:
+            assert parse_naming_template(template, values) == expected
+
+        # A different template with overlapping blocks renders independently
+        assert parse_naming_template("{Title}{ - Part }{PartNumber}", cases[1][0]) == "U - Part 02"
+
 
 class TestArbitraryPrefixSuffix:
     """Tests for enhanced template syntax with arbitrary prefix/suffix text."""
@@ -269,3 +269,14 @@ def test_note_possible_dns_interference_no_detection_keeps_flag_false(monkeypatc
 
     assert network.note_possible_dns_interference("annas-archive.pk") is False
     assert network.dns_interference_detected() is False
+
+
+def test_custom_resolver_caches_answers():
+    import dns.resolver
+
+    import shelfmark.download.network as network
+
+    resolver = network.create_custom_resolver(["1.1.1.1"])
+
+    assert isinstance(resolver.cache, dns.resolver.LRUCache)
+    assert network.create_custom_resolver(["1.1.1.1"]).cache is not resolver.cache
@@ -13,3 +13,20 @@ class TestMetadataProviderCapabilities:
 
     def test_providers_without_capabilities_return_empty_list(self):
         assert get_provider_capabilities("openlibrary") == []
+
+
+def test_list_enabled_providers_refreshes_config_once(monkeypatch):
+    from shelfmark.core.config import config
+    from shelfmark.metadata_providers import get_enabled_providers, list_enabled_providers
+
+    refreshes: list[bool] = []
+    monkeypatch.setattr(config, "refresh", lambda **_kwargs: refreshes.append(True))
+    monkeypatch.setattr(
+        config,
+        "get",
+        lambda key, default=None, **_kwargs: key == "HARDCOVER_ENABLED" or default,
+    )
+
+    assert [info["name"] for info in list_enabled_providers()] == ["hardcover"]
+    assert refreshes == [True]
+    assert get_enabled_providers() == ["hardcover"]